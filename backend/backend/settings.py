@@ -93,6 +93,48 @@ else:
         }
     }
 
+# Optional streaming replica; read-only views opt in with .using(READ_DB)
+# and everything else (including all writes) stays on the primary
+DATABASE_REPLICA_URL = os.environ.get('DATABASE_REPLICA_URL')
+if DATABASE_URL and DATABASE_REPLICA_URL:
+    DATABASES["replica"] = dj_database_url.parse(DATABASE_REPLICA_URL, conn_max_age=600)
+    DATABASE_ROUTERS = ["gallery.routers.PrimaryReplicaRouter"]
+
+# Cache configuration
+# Use Redis when REDIS_URL is set, per-process memory for local development
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Celery configuration
+# Tasks run inline when no Redis broker is configured (local development)
+CELERY_BROKER_URL = REDIS_URL
+CELERY_RESULT_BACKEND = REDIS_URL
+CELERY_TASK_ALWAYS_EAGER = not REDIS_URL
+# With REDIS_URL set, every task (including AI generation) waits on the
+# default queue for a worker: celery -A backend worker -B
+CELERY_BEAT_SCHEDULE = {
+    'recompute-trending': {
+        'task': 'gallery.tasks.recompute_trending',
+        'schedule': 300,
+    },
+    'close-auctions': {
+        'task': 'gallery.tasks.close_auctions',
+        'schedule': 60,
+    },
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
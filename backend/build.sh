@@ -10,3 +10,6 @@ python manage.py collectstatic --no-input
 
 # Run migrations
 python manage.py migrate
+
+# Render thumbnails for artworks saved before they existed
+python manage.py backfill_thumbnails
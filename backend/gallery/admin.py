@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count
 from .models import (
     UserProfile, Category, Tag, Artwork, Like, Comment,
     Collection, Bid, Transaction, Notification, Follow, AIGenerationTask
@@ -30,9 +31,10 @@ class TagAdmin(admin.ModelAdmin):
 @admin.register(Artwork)
 class ArtworkAdmin(admin.ModelAdmin):
     list_display = ['title', 'owner', 'status', 'price', 'is_for_sale', 'is_auction', 'views', 'likes_count', 'created_at']
+    list_select_related = ['owner']
     list_filter = ['status', 'is_for_sale', 'is_auction', 'ai_model', 'category', 'created_at']
     search_fields = ['title', 'description', 'prompt', 'owner__username']
-    readonly_fields = ['id', 'views', 'likes_count', 'created_at', 'updated_at']
+    readonly_fields = ['id', 'views', 'likes_count', 'highest_bid_amount', 'highest_bidder', 'created_at', 'updated_at']
     raw_id_fields = ['owner', 'creator', 'category']
     filter_horizontal = ['tags']
     
@@ -41,14 +43,15 @@ class ArtworkAdmin(admin.ModelAdmin):
             'fields': ('id', 'title', 'description', 'status')
         }),
         ('Images', {
-            'fields': ('image', 'thumbnail', 'image_url')
+            'fields': ('image', 'thumbnail', 'thumbnail_small', 'image_url')
         }),
         ('AI Generation', {
             'fields': ('prompt', 'negative_prompt', 'ai_model', 'seed', 'steps', 'cfg_scale', 'width', 'height'),
             'classes': ('collapse',)
         }),
         ('Marketplace', {
-            'fields': ('price', 'is_for_sale', 'is_auction', 'auction_end_time', 'minimum_bid', 'license_type')
+            'fields': ('price', 'is_for_sale', 'is_auction', 'auction_end_time', 'minimum_bid',
+                       'highest_bid_amount', 'highest_bidder', 'license_type')
         }),
         ('Relationships', {
             'fields': ('owner', 'creator', 'category', 'tags')
@@ -63,6 +66,7 @@ class ArtworkAdmin(admin.ModelAdmin):
 @admin.register(Like)
 class LikeAdmin(admin.ModelAdmin):
     list_display = ['user', 'artwork', 'created_at']
+    list_select_related = ['user', 'artwork']
     list_filter = ['created_at']
     raw_id_fields = ['user', 'artwork']
 
@@ -70,6 +74,7 @@ class LikeAdmin(admin.ModelAdmin):
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ['user', 'artwork', 'content_preview', 'created_at']
+    list_select_related = ['user', 'artwork']
     list_filter = ['created_at']
     search_fields = ['content', 'user__username', 'artwork__title']
     raw_id_fields = ['user', 'artwork', 'parent']
@@ -82,19 +87,25 @@ class CommentAdmin(admin.ModelAdmin):
 @admin.register(Collection)
 class CollectionAdmin(admin.ModelAdmin):
     list_display = ['name', 'owner', 'is_public', 'artworks_count', 'created_at']
+    list_select_related = ['owner']
     list_filter = ['is_public', 'created_at']
     search_fields = ['name', 'description', 'owner__username']
     raw_id_fields = ['owner']
     filter_horizontal = ['artworks']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(artworks_total=Count('artworks'))
+    
     def artworks_count(self, obj):
-        return obj.artworks.count()
+        return obj.artworks_total
     artworks_count.short_description = 'Artworks'
+    artworks_count.admin_order_field = 'artworks_total'
 
 
 @admin.register(Bid)
 class BidAdmin(admin.ModelAdmin):
     list_display = ['artwork', 'bidder', 'amount', 'is_winning', 'created_at']
+    list_select_related = ['artwork', 'bidder']
     list_filter = ['is_winning', 'created_at']
     search_fields = ['artwork__title', 'bidder__username']
     raw_id_fields = ['artwork', 'bidder']
@@ -102,16 +113,18 @@ class BidAdmin(admin.ModelAdmin):
 
 @admin.register(Transaction)
 class TransactionAdmin(admin.ModelAdmin):
-    list_display = ['id', 'transaction_type', 'buyer', 'seller', 'amount', 'status', 'created_at']
+    list_display = ['public_id', 'transaction_type', 'buyer', 'seller', 'amount', 'status', 'created_at']
+    list_select_related = ['buyer', 'seller']
     list_filter = ['transaction_type', 'status', 'created_at']
     search_fields = ['buyer__username', 'seller__username', 'artwork__title']
     raw_id_fields = ['buyer', 'seller', 'artwork']
-    readonly_fields = ['id', 'created_at', 'completed_at']
+    readonly_fields = ['public_id', 'created_at', 'completed_at']
 
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
     list_display = ['user', 'notification_type', 'title', 'is_read', 'created_at']
+    list_select_related = ['user']
     list_filter = ['notification_type', 'is_read', 'created_at']
     search_fields = ['user__username', 'title', 'message']
     raw_id_fields = ['user']
@@ -120,6 +133,7 @@ class NotificationAdmin(admin.ModelAdmin):
 @admin.register(Follow)
 class FollowAdmin(admin.ModelAdmin):
     list_display = ['follower', 'followed', 'created_at']
+    list_select_related = ['follower', 'followed']
     list_filter = ['created_at']
     search_fields = ['follower__username', 'followed__username']
     raw_id_fields = ['follower', 'followed']
@@ -127,8 +141,9 @@ class FollowAdmin(admin.ModelAdmin):
 
 @admin.register(AIGenerationTask)
 class AIGenerationTaskAdmin(admin.ModelAdmin):
-    list_display = ['id', 'user', 'status', 'ai_model', 'created_at', 'completed_at']
+    list_display = ['public_id', 'user', 'status', 'ai_model', 'created_at', 'completed_at']
+    list_select_related = ['user']
     list_filter = ['status', 'ai_model', 'created_at']
     search_fields = ['user__username', 'prompt']
     raw_id_fields = ['user']
-    readonly_fields = ['id', 'created_at', 'completed_at']
+    readonly_fields = ['public_id', 'created_at', 'completed_at']
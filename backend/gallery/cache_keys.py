@@ -0,0 +1,22 @@
+"""Cache keys shared by the views that fill them and the signals that clear them"""
+
+CATEGORY_LIST_KEY = 'categories:list:v1'
+TAG_LIST_KEY = 'tags:list:v1'
+TAG_POPULAR_KEY = 'tags:popular:v1'
+PLACEHOLDER_KEY_PREFIX = 'placeholder:v2:'
+GENERATION_KEY_PREFIX = 'generation:v2:'
+GENERATION_RESULT_KEY = 'generation:result:v1:{}'
+MARKETPLACE_STATS_KEY = 'marketplace:stats:v1'
+FEATURED_IDS_KEY = 'artworks:featured-ids:v1'
+TRENDING_IDS_KEY = 'artworks:trending-ids:v1'
+ARTWORK_VIEWS_KEY = 'artwork:views:v1:{}:{}'
+
+LIST_CACHE_TIMEOUT = 300
+MARKETPLACE_STATS_TIMEOUT = 60
+# Refreshed every five minutes by celery beat; the margin covers a late run
+TRENDING_CACHE_TIMEOUT = 15 * 60
+PLACEHOLDER_CACHE_TIMEOUT = 60 * 60 * 24
+GENERATION_CACHE_TIMEOUT = 60 * 60 * 24
+GENERATION_RESULT_TIMEOUT = 60 * 60
+# Views are buffered per artwork and written back once per window
+VIEW_FLUSH_INTERVAL = 30
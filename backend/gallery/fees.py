@@ -0,0 +1,16 @@
+"""Marketplace fees shared by direct purchases and auction settlement"""
+
+from decimal import Decimal
+
+# Share of every sale kept by the marketplace
+PLATFORM_FEE_RATE = Decimal('0.05')
+CENT = Decimal('0.01')
+
+
+def platform_fee(price):
+    """
+    The marketplace's cut of a sale, rounded to cents here so the fee
+    recorded on the transaction and the amount credited to the seller
+    add up to the price exactly
+    """
+    return (price * PLATFORM_FEE_RATE).quantize(CENT)
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from gallery.models import Artwork
+from gallery.tasks import generate_thumbnails
+
+
+class Command(BaseCommand):
+    help = 'Queue thumbnail generation for artworks that are missing a thumbnail size'
+
+    def handle(self, *args, **options):
+        # Empty file fields are stored as '' but older rows may hold NULL
+        ids = Artwork.objects.exclude(image='').filter(
+            Q(thumbnail_small='') | Q(thumbnail_small__isnull=True)
+        ).values_list('id', flat=True).iterator()
+        queued = 0
+        for artwork_id in ids:
+            generate_thumbnails.delay(str(artwork_id))
+            queued += 1
+        self.stdout.write(f'Queued thumbnails for {queued} artworks')
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-15 09:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_highest_bids(apps, schema_editor):
+    Artwork = apps.get_model('gallery', 'Artwork')
+    Bid = apps.get_model('gallery', 'Bid')
+    artworks = []
+    for artwork in Artwork.objects.filter(bids__isnull=False).distinct():
+        highest = Bid.objects.filter(artwork=artwork).order_by('-amount').first()
+        artwork.highest_bid_amount = highest.amount
+        artwork.highest_bidder_id = highest.bidder_id
+        artworks.append(artwork)
+    Artwork.objects.bulk_update(artworks, ['highest_bid_amount', 'highest_bidder'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0002_add_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artwork',
+            name='highest_bid_amount',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='artwork',
+            name='highest_bidder',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='leading_bids', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(backfill_highest_bids, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-15 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0003_artwork_highest_bid'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='notification_type',
+            field=models.CharField(choices=[('like', 'New Like'), ('comment', 'New Comment'), ('follow', 'New Follower'), ('sale', 'Artwork Sold'), ('bid', 'New Bid'), ('outbid', 'Outbid'), ('auction_won', 'Auction Won'), ('new_artwork', 'New Artwork'), ('system', 'System')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,185 @@
+# Generated by Django 6.0.1 on 2026-10-15 10:30
+#
+# Transaction and AIGenerationTask move from random UUID primary keys to
+# BigAutoField, keeping the old UUID as public_id. Postgres cannot cast a
+# uuid column to bigint, and nothing references these tables, so each one is
+# rebuilt: create the new table, copy rows in created_at order, drop the old
+# table and rename the new one into place. On Postgres the sequences, indexes
+# and constraints created for the copies are then renamed to match.
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+TRANSACTION_FIELDS = [
+    'transaction_type', 'buyer_id', 'seller_id', 'artwork_id', 'amount', 'platform_fee',
+    'status', 'stripe_payment_id', 'created_at', 'completed_at',
+]
+
+GENERATION_TASK_FIELDS = [
+    'user_id', 'prompt', 'negative_prompt', 'ai_model', 'width', 'height', 'steps',
+    'cfg_scale', 'seed', 'status', 'result_image', 'error_message', 'created_at', 'completed_at',
+]
+
+
+def copy_rows(apps, old_name, new_name, fields):
+    OldModel = apps.get_model('gallery', old_name)
+    NewModel = apps.get_model('gallery', new_name)
+    rows = (
+        NewModel(public_id=old.pk, **{field: getattr(old, field) for field in fields})
+        for old in OldModel.objects.order_by('created_at').iterator(chunk_size=500)
+    )
+    NewModel.objects.bulk_create(rows, batch_size=500)
+
+
+# Table each copy was created as -> the table it is renamed to
+REBUILT_TABLES = {
+    'gallery_newtransaction': 'gallery_transaction',
+    'gallery_newaigenerationtask': 'gallery_aigenerationtask',
+}
+
+
+def rename_rebuilt_objects(apps, schema_editor):
+    """Drop the copy's table prefix from the sequences, indexes and constraints it left behind"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    quote = schema_editor.quote_name
+    with schema_editor.connection.cursor() as cursor:
+        for old, new in REBUILT_TABLES.items():
+            # Renaming the index behind a primary key or unique constraint
+            # renames the constraint with it
+            cursor.execute(
+                "SELECT c.relname, c.relkind FROM pg_class c "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = current_schema() AND c.relkind IN ('i', 'S') AND starts_with(c.relname, %s)",
+                [old],
+            )
+            for name, kind in cursor.fetchall():
+                statement = 'ALTER INDEX' if kind == 'i' else 'ALTER SEQUENCE'
+                schema_editor.execute(f'{statement} {quote(name)} RENAME TO {quote(new + name[len(old):])}')
+            # Foreign keys and checks have no index of their own
+            cursor.execute(
+                "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND starts_with(conname, %s)",
+                [new, old],
+            )
+            for (name,) in cursor.fetchall():
+                schema_editor.execute(
+                    f'ALTER TABLE {quote(new)} RENAME CONSTRAINT {quote(name)} TO {quote(new + name[len(old):])}'
+                )
+
+
+def copy_transactions(apps, schema_editor):
+    copy_rows(apps, 'Transaction', 'NewTransaction', TRANSACTION_FIELDS)
+
+
+def copy_generation_tasks(apps, schema_editor):
+    copy_rows(apps, 'AIGenerationTask', 'NewAIGenerationTask', GENERATION_TASK_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0004_alter_notification_notification_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # created_at is a plain DateTimeField and reverse accessors are hidden
+        # while the copies exist, so the original timestamps survive the copy
+        # and the related names don't clash with the old models
+        migrations.CreateModel(
+            name='NewTransaction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('public_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('transaction_type', models.CharField(choices=[('purchase', 'Purchase'), ('sale', 'Sale'), ('bid_won', 'Auction Won'), ('deposit', 'Deposit'), ('withdrawal', 'Withdrawal'), ('commission', 'Commission')], max_length=20)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('platform_fee', models.DecimalField(decimal_places=2, default=0.0, max_digits=10)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed'), ('failed', 'Failed'), ('refunded', 'Refunded')], default='pending', max_length=20)),
+                ('stripe_payment_id', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField()),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('artwork', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='gallery.artwork')),
+                ('buyer', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('seller', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='NewAIGenerationTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('public_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('prompt', models.TextField()),
+                ('negative_prompt', models.TextField(blank=True)),
+                ('ai_model', models.CharField(default='stable_diffusion', max_length=50)),
+                ('width', models.IntegerField(default=512)),
+                ('height', models.IntegerField(default=512)),
+                ('steps', models.IntegerField(default=50)),
+                ('cfg_scale', models.FloatField(default=7.5)),
+                ('seed', models.BigIntegerField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('result_image', models.ImageField(blank=True, null=True, upload_to='generated/%Y/%m/')),
+                ('error_message', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField()),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.RunPython(copy_transactions, migrations.RunPython.noop),
+        migrations.RunPython(copy_generation_tasks, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name='Transaction',
+        ),
+        migrations.DeleteModel(
+            name='AIGenerationTask',
+        ),
+        migrations.RenameModel(
+            old_name='NewTransaction',
+            new_name='Transaction',
+        ),
+        migrations.RenameModel(
+            old_name='NewAIGenerationTask',
+            new_name='AIGenerationTask',
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='artwork',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='transactions', to='gallery.artwork'),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='buyer',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='purchases', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='seller',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sales', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='aigenerationtask',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='aigenerationtask',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='generation_tasks', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['buyer', '-created_at'], name='transaction_buyer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['seller', '-created_at'], name='transaction_seller_created_idx'),
+        ),
+        migrations.RunPython(rename_rebuilt_objects, migrations.RunPython.noop),
+    ]
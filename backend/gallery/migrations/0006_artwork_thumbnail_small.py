@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-15 10:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0005_bigint_pk_transaction_aigenerationtask'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artwork',
+            name='thumbnail_small',
+            field=models.ImageField(blank=True, null=True, upload_to='thumbnails/%Y/%m/'),
+        ),
+    ]
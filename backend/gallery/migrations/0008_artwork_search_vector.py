@@ -0,0 +1,42 @@
+# Generated by Django 6.0.1 on 2026-10-15 11:40
+#
+# The GIN index and the backfill only apply on PostgreSQL; SQLite development
+# databases keep the column empty and search falls back to substring matches.
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    from django.contrib.postgres.search import SearchVector
+    Artwork = apps.get_model('gallery', 'Artwork')
+    Artwork.objects.update(search_vector=(
+        SearchVector('title', weight='A') + SearchVector('prompt', weight='B') + SearchVector('description', weight='C')
+    ))
+    schema_editor.execute(
+        'CREATE INDEX artwork_search_vector_idx ON gallery_artwork USING gin (search_vector)'
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS artwork_search_vector_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0007_backfill_user_profiles'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artwork',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
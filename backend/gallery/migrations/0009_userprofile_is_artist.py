@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+def flag_existing_artists(apps, schema_editor):
+    Artwork = apps.get_model('gallery', 'Artwork')
+    UserProfile = apps.get_model('gallery', 'UserProfile')
+    UserProfile.objects.filter(user_id__in=Artwork.objects.values('owner_id')).update(is_artist=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0008_artwork_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='is_artist',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(condition=models.Q(('is_artist', True)), fields=['is_artist'], name='profile_artist_idx'),
+        ),
+        migrations.RunPython(flag_existing_artists, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchVectorField
 from django.utils import timezone
 import uuid
 
@@ -15,8 +16,15 @@ class UserProfile(models.Model):
     is_verified_artist = models.BooleanField(default=False)
     wallet_balance = models.DecimalField(max_digits=12, decimal_places=2, default=0.00)
     total_sales = models.DecimalField(max_digits=12, decimal_places=2, default=0.00)
+    # Set once the user owns their first artwork; kept by a signal
+    is_artist = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_artist'], condition=models.Q(is_artist=True), name='profile_artist_idx'),
+        ]
+    
     def __str__(self):
         return f"{self.user.username}'s profile"
 
@@ -69,6 +77,7 @@ class Artwork(models.Model):
     # Image fields
     image = models.ImageField(upload_to='artworks/%Y/%m/')
     thumbnail = models.ImageField(upload_to='thumbnails/%Y/%m/', blank=True, null=True)
+    thumbnail_small = models.ImageField(upload_to='thumbnails/%Y/%m/', blank=True, null=True)
     image_url = models.URLField(blank=True, null=True)  # For external images
     
     # AI Generation details
@@ -87,6 +96,8 @@ class Artwork(models.Model):
     is_auction = models.BooleanField(default=False)
     auction_end_time = models.DateTimeField(null=True, blank=True)
     minimum_bid = models.DecimalField(max_digits=12, decimal_places=2, default=0.00)
+    highest_bid_amount = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    highest_bidder = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='leading_bids')
     
     # Relationships
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='artworks')
@@ -101,6 +112,10 @@ class Artwork(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # Full-text index over title/prompt/description, maintained by a signal
+    # on PostgreSQL and left empty elsewhere
+    search_vector = SearchVectorField(null=True, editable=False)
+    
     # Licensing
     license_type = models.CharField(max_length=50, default='personal', 
                                     choices=[('personal', 'Personal Use'), 
@@ -109,13 +124,28 @@ class Artwork(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='artwork_created_idx'),
+            models.Index(fields=['status', 'is_for_sale'], name='artwork_status_sale_idx'),
+            models.Index(fields=['owner', 'status'], name='artwork_owner_status_idx'),
+            models.Index(fields=['category', 'status'], name='artwork_category_status_idx'),
+            models.Index(fields=['status', '-created_at'], name='artwork_status_created_idx'),
+            models.Index(fields=['owner', '-created_at'], name='artwork_owner_created_idx'),
+            # Only published auctions are ever filtered by end time
+            models.Index(fields=['is_auction', 'auction_end_time'], condition=models.Q(status='published'),
+                         name='artwork_active_auction_idx'),
+        ]
     
     def __str__(self):
         return self.title
     
-    def increment_views(self):
-        self.views += 1
-        self.save(update_fields=['views'])
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The stored image name, so a replaced image can be spotted on save
+        # without reading the row again (absent when the column was deferred)
+        instance._loaded_image = instance.__dict__.get('image')
+        return instance
 
 
 class Like(models.Model):
@@ -172,6 +202,9 @@ class Bid(models.Model):
     
     class Meta:
         ordering = ['-amount']
+        indexes = [
+            models.Index(fields=['artwork', '-amount'], name='bid_artwork_amount_idx'),
+        ]
     
     def __str__(self):
         return f"${self.amount} bid on {self.artwork.title} by {self.bidder.username}"
@@ -196,7 +229,8 @@ class Transaction(models.Model):
         ('refunded', 'Refunded'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Sequential primary key for index locality; the UUID is what the API exposes
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     transaction_type = models.CharField(max_length=20, choices=TRANSACTION_TYPES)
     buyer = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='purchases')
     seller = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='sales')
@@ -208,6 +242,12 @@ class Transaction(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['buyer', '-created_at'], name='transaction_buyer_created_idx'),
+            models.Index(fields=['seller', '-created_at'], name='transaction_seller_created_idx'),
+        ]
+    
     def __str__(self):
         return f"{self.transaction_type}: ${self.amount}"
 
@@ -223,6 +263,7 @@ class Notification(models.Model):
         ('bid', 'New Bid'),
         ('outbid', 'Outbid'),
         ('auction_won', 'Auction Won'),
+        ('new_artwork', 'New Artwork'),
         ('system', 'System'),
     ]
     
@@ -236,6 +277,10 @@ class Notification(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'is_read', '-created_at'], name='notification_user_unread_idx'),
+            models.Index(fields=['user', '-created_at'], name='notification_user_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.notification_type} for {self.user.username}"
@@ -264,7 +309,7 @@ class AIGenerationTask(models.Model):
         ('failed', 'Failed'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='generation_tasks')
     prompt = models.TextField()
     negative_prompt = models.TextField(blank=True)
@@ -281,4 +326,4 @@ class AIGenerationTask(models.Model):
     completed_at = models.DateTimeField(null=True, blank=True)
     
     def __str__(self):
-        return f"Generation task {self.id} - {self.status}"
+        return f"Generation task {self.public_id} - {self.status}"
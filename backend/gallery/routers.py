@@ -0,0 +1,27 @@
+"""Database routing between the primary and the optional read replica"""
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+# Alias that read-only views query; the primary when no replica is configured
+READ_DB = 'replica' if 'replica' in settings.DATABASES else DEFAULT_DB_ALIAS
+
+
+class PrimaryReplicaRouter:
+    """
+    Reads stay on the primary unless a view opts in with .using(READ_DB).
+    Writes always go to the primary, even for objects loaded from the replica,
+    and the replica (a copy of the primary) is never migrated.
+    """
+    
+    def db_for_read(self, model, **hints):
+        return None
+    
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+    
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+    
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
+from django.db import transaction
 from .models import (
     UserProfile, Category, Tag, Artwork, Like, Comment, 
     Collection, Bid, Transaction, Notification, Follow, AIGenerationTask
@@ -19,13 +20,21 @@ class UserSerializer(serializers.ModelSerializer):
                   'date_joined', 'followers_count', 'following_count', 'artworks_count']
         read_only_fields = ['date_joined']
     
+    # Counts come from queryset annotations where the view provides them;
+    # nested users (owners, bidders, ...) fall back to a COUNT query.
     def get_followers_count(self, obj):
+        if hasattr(obj, 'followers_count'):
+            return obj.followers_count
         return obj.followers.count()
     
     def get_following_count(self, obj):
+        if hasattr(obj, 'following_count'):
+            return obj.following_count
         return obj.following.count()
     
     def get_artworks_count(self, obj):
+        if hasattr(obj, 'artworks_count'):
+            return obj.artworks_count
         return obj.artworks.filter(status='published').count()
 
 
@@ -57,8 +66,9 @@ class RegisterSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         validated_data.pop('password2')
-        user = User.objects.create_user(**validated_data)
-        UserProfile.objects.create(user=user)
+        # The profile is created by the User post_save signal in the same transaction
+        with transaction.atomic():
+            user = User.objects.create_user(**validated_data)
         return user
 
 
@@ -71,6 +81,8 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'slug', 'description', 'icon', 'artworks_count']
     
     def get_artworks_count(self, obj):
+        if hasattr(obj, 'artworks_count'):
+            return obj.artworks_count
         return obj.artworks.filter(status='published').count()
 
 
@@ -85,7 +97,7 @@ class ArtworkListSerializer(serializers.ModelSerializer):
     """Artwork list serializer (lightweight)"""
     owner = UserSerializer(read_only=True)
     category = CategorySerializer(read_only=True)
-    is_liked = serializers.SerializerMethodField()
+    is_liked = serializers.BooleanField(read_only=True, default=False)
     
     class Meta:
         model = Artwork
@@ -93,11 +105,12 @@ class ArtworkListSerializer(serializers.ModelSerializer):
                   'is_for_sale', 'is_auction', 'owner', 'category', 'views', 
                   'likes_count', 'created_at', 'is_liked', 'ai_model']
     
-    def get_is_liked(self, obj):
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return obj.likes.filter(user=request.user).exists()
-        return False
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Cards only fall back to the full-resolution image until a thumbnail exists
+        if data.get('thumbnail'):
+            data['image'] = None
+        return data
 
 
 class ArtworkDetailSerializer(serializers.ModelSerializer):
@@ -106,29 +119,25 @@ class ArtworkDetailSerializer(serializers.ModelSerializer):
     creator = UserSerializer(read_only=True)
     category = CategorySerializer(read_only=True)
     tags = TagSerializer(many=True, read_only=True)
-    is_liked = serializers.SerializerMethodField()
+    is_liked = serializers.BooleanField(read_only=True, default=False)
     comments_count = serializers.SerializerMethodField()
     highest_bid = serializers.SerializerMethodField()
     
     class Meta:
         model = Artwork
-        fields = '__all__'
-        read_only_fields = ['id', 'owner', 'creator', 'views', 'likes_count', 'created_at', 'updated_at']
-    
-    def get_is_liked(self, obj):
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return obj.likes.filter(user=request.user).exists()
-        return False
+        exclude = ['search_vector']
+        read_only_fields = ['id', 'owner', 'creator', 'views', 'likes_count', 'created_at', 'updated_at',
+                            'highest_bid_amount', 'highest_bidder']
     
     def get_comments_count(self, obj):
+        if hasattr(obj, 'comments_count'):
+            return obj.comments_count
         return obj.comments.count()
     
     def get_highest_bid(self, obj):
-        if obj.is_auction:
-            highest = obj.bids.first()
-            if highest:
-                return {'amount': highest.amount, 'bidder': highest.bidder.username}
+        if obj.is_auction and obj.highest_bid_amount is not None:
+            bidder = obj.highest_bidder
+            return {'amount': obj.highest_bid_amount, 'bidder': bidder.username if bidder else None}
         return None
 
 
@@ -149,18 +158,27 @@ class ArtworkCreateSerializer(serializers.ModelSerializer):
         tags_data = validated_data.pop('tags', [])
         category_id = validated_data.pop('category_id', None)
         
-        artwork = Artwork.objects.create(**validated_data)
-        
         if category_id:
-            artwork.category_id = category_id
-            artwork.save()
+            validated_data['category_id'] = category_id
         
-        for tag_name in tags_data:
-            tag, _ = Tag.objects.get_or_create(
-                name=tag_name.lower().strip(),
-                defaults={'slug': tag_name.lower().strip().replace(' ', '-')}
-            )
-            artwork.tags.add(tag)
+        with transaction.atomic():
+            artwork = Artwork.objects.create(**validated_data)
+            
+            # Create missing tags in one INSERT and attach them all at once;
+            # a tag created concurrently by another request is skipped by
+            # ignore_conflicts and picked up by the re-read
+            names = {tag_name.lower().strip() for tag_name in tags_data}
+            if names:
+                tags = list(Tag.objects.filter(name__in=names))
+                missing = names - {tag.name for tag in tags}
+                if missing:
+                    Tag.objects.bulk_create(
+                        [Tag(name=name, slug=name.replace(' ', '-')) for name in missing],
+                        ignore_conflicts=True
+                    )
+                    # ignore_conflicts doesn't return primary keys, so re-read the full set
+                    tags = Tag.objects.filter(name__in=names)
+                artwork.tags.add(*tags)
         
         return artwork
 
@@ -176,8 +194,11 @@ class CommentSerializer(serializers.ModelSerializer):
         read_only_fields = ['user', 'created_at', 'updated_at']
     
     def get_replies(self, obj):
-        if obj.parent is None:
-            replies = obj.replies.all()[:5]
+        if obj.parent_id is None:
+            if hasattr(obj, 'prefetched_replies'):
+                replies = obj.prefetched_replies[:5]
+            else:
+                replies = obj.replies.select_related('user')[:5]
             return CommentSerializer(replies, many=True, context=self.context).data
         return []
 
@@ -196,11 +217,16 @@ class CollectionSerializer(serializers.ModelSerializer):
         read_only_fields = ['owner', 'created_at', 'updated_at']
     
     def get_artworks_count(self, obj):
+        if hasattr(obj, 'artworks_count'):
+            return obj.artworks_count
         return obj.artworks.count()
     
     def get_preview_artworks(self, obj):
-        artworks = obj.artworks.all()[:4]
-        return [{'id': a.id, 'thumbnail': a.thumbnail.url if a.thumbnail else None} for a in artworks]
+        if hasattr(obj, 'prefetched_previews'):
+            artworks = obj.prefetched_previews
+        else:
+            artworks = obj.artworks.only('id', 'thumbnail_small')[:4]
+        return [{'id': a.id, 'thumbnail': a.thumbnail_small.url if a.thumbnail_small else None} for a in artworks]
 
 
 class BidSerializer(serializers.ModelSerializer):
@@ -222,9 +248,8 @@ class BidSerializer(serializers.ModelSerializer):
         if amount < artwork.minimum_bid:
             raise serializers.ValidationError(f"Bid must be at least ${artwork.minimum_bid}")
         
-        highest_bid = artwork.bids.first()
-        if highest_bid and amount <= highest_bid.amount:
-            raise serializers.ValidationError(f"Bid must be higher than ${highest_bid.amount}")
+        if artwork.highest_bid_amount is not None and amount <= artwork.highest_bid_amount:
+            raise serializers.ValidationError(f"Bid must be higher than ${artwork.highest_bid_amount}")
         
         return attrs
 
@@ -234,6 +259,7 @@ class TransactionSerializer(serializers.ModelSerializer):
     buyer = UserSerializer(read_only=True)
     seller = UserSerializer(read_only=True)
     artwork = ArtworkListSerializer(read_only=True)
+    id = serializers.UUIDField(source='public_id', read_only=True)
     
     class Meta:
         model = Transaction
@@ -263,6 +289,8 @@ class FollowSerializer(serializers.ModelSerializer):
 
 class AIGenerationTaskSerializer(serializers.ModelSerializer):
     """AI generation task serializer"""
+    id = serializers.UUIDField(source='public_id', read_only=True)
+    
     class Meta:
         model = AIGenerationTask
         fields = ['id', 'prompt', 'negative_prompt', 'ai_model', 'width', 
@@ -8,12 +8,167 @@ import io
 import base64
 import random
 import hashlib
-from datetime import datetime
+import uuid
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache, partial
+from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
+import numpy as np
 from PIL import Image
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
-from django.core.files.base import ContentFile
+from django.core.cache import cache
+
+from .cache_keys import (
+    GENERATION_KEY_PREFIX, GENERATION_CACHE_TIMEOUT, PLACEHOLDER_KEY_PREFIX, PLACEHOLDER_CACHE_TIMEOUT,
+)
+
+
+# Read-only so the shared table can't be changed from a request
+STYLE_MODIFIERS = MappingProxyType({
+    'photorealistic': 'photorealistic, highly detailed, 8k resolution, professional photography, dramatic lighting',
+    'artistic': 'artistic, oil painting style, masterpiece, vibrant colors, detailed brushwork',
+    'anime': 'anime style, detailed anime art, vibrant colors, dynamic pose, studio quality',
+    'digital_art': 'digital art, concept art, trending on artstation, highly detailed, vibrant',
+    'fantasy': 'fantasy art, magical, ethereal lighting, detailed environment, epic composition',
+    'cyberpunk': 'cyberpunk style, neon lights, futuristic, high tech, rain, night city',
+    'watercolor': 'watercolor painting, soft colors, artistic, delicate, flowing',
+    'sketch': 'pencil sketch, detailed linework, artistic, professional illustration',
+    'default': 'high quality, detailed, professional'
+})
+DEFAULT_STYLE_MODIFIER = STYLE_MODIFIERS['default']
+
+PROMPT_SUGGESTIONS = {
+    'landscape': (
+        "A serene mountain lake at sunset with snow-capped peaks reflecting in crystal clear water",
+        "Enchanted forest with bioluminescent plants and mystical creatures",
+        "Futuristic cityscape with flying vehicles and holographic advertisements",
+        "Underwater coral reef paradise with colorful fish and sunbeams"
+    ),
+    'portrait': (
+        "Elegant portrait of a mysterious figure in Renaissance style clothing",
+        "Cyberpunk character with neon hair and augmented reality glasses",
+        "Fantasy warrior princess with intricate armor and magical aura",
+        "Steampunk inventor surrounded by clockwork mechanisms"
+    ),
+    'abstract': (
+        "Swirling galaxies of color representing the human consciousness",
+        "Geometric patterns flowing like liquid metal in zero gravity",
+        "Emotional explosion of colors representing joy and creativity",
+        "Fractal patterns inspired by nature's mathematical beauty"
+    ),
+    'fantasy': (
+        "Ancient dragon perched atop a crystal mountain at twilight",
+        "Magical library with floating books and ethereal librarians",
+        "Enchanted castle in the clouds with rainbow bridges",
+        "Mythical phoenix rising from flames in a starlit sky"
+    ),
+    'scifi': (
+        "Space station orbiting a gas giant with multiple moons visible",
+        "Alien marketplace on a distant planet with exotic species",
+        "Time travel portal opening in a Victorian laboratory",
+        "Robot and human collaboration in a futuristic workshop"
+    )
+}
+
+ALL_PROMPT_SUGGESTIONS = tuple(chain.from_iterable(PROMPT_SUGGESTIONS.values()))
+
+
+# One keep-alive session per process so repeat generations reuse the TLS
+# connection to each provider instead of handshaking on every call
+_http = requests.Session()
+_http.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+PROVIDER_TIMEOUT = 120
+
+# Upstream HTTP calls allowed per provider at once from this process, and
+# the requests currently waiting on one, keyed like the generation cache
+PROVIDER_CONCURRENCY = getattr(settings, 'AI_PROVIDER_CONCURRENCY', 4)
+_provider_slots = {
+    provider: threading.BoundedSemaphore(PROVIDER_CONCURRENCY)
+    for provider in ('stability', 'dalle', 'huggingface')
+}
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+# Provider downloads are copied to disk in 192 KiB pieces (a multiple of three,
+# so each piece base64 encodes without padding)
+STREAM_CHUNK_SIZE = 3 << 16
+
+# Image files are written in the background while the response is built;
+# a small shared pool keeps concurrent requests from piling up disk writers
+_io_pool = ThreadPoolExecutor(max_workers=4)
+
+
+def _batch_stamp():
+    """Filename suffix shared by every image of one generation call; the random
+    part keeps concurrent requests with the same seed from overwriting each other"""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+@lru_cache(maxsize=64)
+def _month_dir(media_root, year, month):
+    """Ensure a generated/YYYY/MM directory exists, once per process and month"""
+    path = media_root / 'generated' / f'{year:04d}' / f'{month:02d}'
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _open_output(path):
+    """
+    Open a generated image for writing; if media cleanup removed the month
+    directory after it was cached, forget it and create it again
+    """
+    try:
+        return open(path, 'wb')
+    except FileNotFoundError:
+        _month_dir.cache_clear()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return open(path, 'wb')
+
+
+def _write_image(path, data):
+    with _open_output(path) as f:
+        f.write(data)
+
+
+def _normalize_prompt(prompt):
+    """Fold case, whitespace and trailing punctuation out of a prompt"""
+    return ' '.join(prompt.lower().split()).rstrip('.,!;')
+
+
+def _dispatch(key, call):
+    """Run a provider call, letting identical requests already in flight share the result"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    
+    if not leader:
+        return future.result()
+    
+    try:
+        result = call()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def _wait_for_writes(futures):
+    """Block until queued image writes have finished, re-raising any IO error"""
+    for future in futures:
+        future.result()
 
 
 class AIArtGenerator:
@@ -27,10 +182,16 @@ class AIArtGenerator:
         self.openai_api_key = getattr(settings, 'OPENAI_API_KEY', os.getenv('OPENAI_API_KEY', ''))
         self.huggingface_token = getattr(settings, 'HUGGINGFACE_TOKEN', os.getenv('HUGGINGFACE_TOKEN', ''))
         
-        # Ensure media directories exist
+        # Placeholders are throwaway demo art, so favour fast zlib over small files
+        self.placeholder_png_level = getattr(settings, 'PLACEHOLDER_PNG_LEVEL', 1)
+        
         self.media_root = Path(settings.MEDIA_ROOT if hasattr(settings, 'MEDIA_ROOT') else 'media')
-        self.generated_dir = self.media_root / 'generated' / datetime.now().strftime('%Y/%m')
-        self.generated_dir.mkdir(parents=True, exist_ok=True)
+    
+    @property
+    def generated_dir(self):
+        """This month's output directory, created on first use"""
+        today = date.today()
+        return _month_dir(self.media_root, today.year, today.month)
     
     def generate(self, prompt, negative_prompt='', width=512, height=512, 
                  steps=50, cfg_scale=7.5, seed=None, num_images=1, ai_model='stable_diffusion'):
@@ -53,22 +214,73 @@ class AIArtGenerator:
         """
         
         if seed is None:
-            seed = random.randint(0, 2147483647)
+            seed = random.getrandbits(31)  # same range as randint(0, 2**31 - 1)
+            repeatable = False
+        else:
+            # Only an explicit seed asks for the same picture again; without
+            # one the user expects fresh images on every call
+            repeatable = True
         
         # Try different backends based on configuration
         if ai_model == 'dalle' and self.openai_api_key:
-            return self._generate_with_dalle(prompt, width, height, num_images, seed)
+            provider = 'dalle'
+            call = partial(self._generate_with_dalle, prompt, width, height, num_images, seed)
         elif self.stability_api_key:
-            return self._generate_with_stability(
+            provider = 'stability'
+            call = partial(
+                self._generate_with_stability,
                 prompt, negative_prompt, width, height, steps, cfg_scale, seed, num_images
             )
         elif self.huggingface_token:
-            return self._generate_with_huggingface(
+            provider = 'huggingface'
+            call = partial(
+                self._generate_with_huggingface,
                 prompt, negative_prompt, width, height, steps, cfg_scale, seed, num_images
             )
         else:
             # Fallback to generating placeholder images for demo
-            return self._generate_placeholder(prompt, width, height, seed, num_images)
+            return self._generate_placeholder(prompt, width, height, seed, num_images, repeatable)
+        
+        cache_key = GENERATION_KEY_PREFIX + hashlib.blake2b(
+            '|'.join(map(str, (
+                provider, _normalize_prompt(prompt), _normalize_prompt(negative_prompt),
+                width, height, steps, cfg_scale, seed, num_images,
+            ))).encode(),
+            digest_size=16
+        ).hexdigest()
+        
+        # A repeat of an earlier seeded request (up to case, spacing and
+        # trailing punctuation in the prompts) reuses the stored images
+        # instead of paying for another provider call. Only the paths are
+        # cached; the base64 is read back from disk
+        if repeatable:
+            cached = cache.get(cache_key)
+            images = cached and self._load_images(cached['paths'])
+            if images:
+                return {
+                    'images': images,
+                    'image_path': cached['paths'][0],
+                    'seed': seed,
+                    'model': cached['model']
+                }
+        
+        result = _dispatch(cache_key, call)
+        if repeatable and result['images']:
+            cache.set(cache_key, {
+                'paths': [image['url'].removeprefix('/media/') for image in result['images']],
+                'model': result['model']
+            }, GENERATION_CACHE_TIMEOUT)
+        return result
+    
+    def _load_images(self, paths):
+        """Images written by an earlier call, or None if any file is gone"""
+        files = [self.media_root / path for path in paths]
+        if not all(f.exists() for f in files):
+            return None
+        return [{
+            'url': f'/media/{path}',
+            'base64': base64.b64encode(f.read_bytes()).decode('ascii')
+        } for path, f in zip(paths, files)]
     
     def _generate_with_stability(self, prompt, negative_prompt, width, height, 
                                   steps, cfg_scale, seed, num_images):
@@ -97,31 +309,41 @@ class AIArtGenerator:
         if negative_prompt:
             body["text_prompts"].append({"text": negative_prompt, "weight": -1.0})
         
-        response = requests.post(url, headers=headers, json=body)
+        with _provider_slots['stability']:
+            response = _http.post(url, headers=headers, json=body, timeout=PROVIDER_TIMEOUT)
         
         if response.status_code != 200:
             raise Exception(f"Stability AI error: {response.text}")
         
         data = response.json()
         images = []
+        writes = []
         image_path = None
         
+        stamp = _batch_stamp()
+        output_dir = self.generated_dir
+        
         for i, artifact in enumerate(data.get("artifacts", [])):
-            img_data = base64.b64decode(artifact["base64"])
-            filename = f"sd_{seed}_{i}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            filepath = self.generated_dir / filename
+            # The response already carries base64; decode it only for the file
+            # and hand the original string back to the client
+            img_base64 = artifact["base64"]
+            img_data = base64.b64decode(img_base64)
+            filename = f"sd_{seed}_{i}_{stamp}.png"
+            filepath = output_dir / filename
             
-            with open(filepath, 'wb') as f:
-                f.write(img_data)
+            writes.append(_io_pool.submit(_write_image, filepath, img_data))
             
+            relative_path = str(filepath.relative_to(self.media_root))
             if i == 0:
-                image_path = str(filepath.relative_to(self.media_root))
+                image_path = relative_path
             
             images.append({
-                'url': f'/media/{filepath.relative_to(self.media_root)}',
-                'base64': artifact["base64"]
+                'url': f'/media/{relative_path}',
+                'base64': img_base64
             })
         
+        _wait_for_writes(writes)
+        
         return {
             'images': images,
             'image_path': image_path,
@@ -155,31 +377,39 @@ class AIArtGenerator:
             "response_format": "b64_json"
         }
         
-        response = requests.post(url, headers=headers, json=body)
+        with _provider_slots['dalle']:
+            response = _http.post(url, headers=headers, json=body, timeout=PROVIDER_TIMEOUT)
         
         if response.status_code != 200:
             raise Exception(f"DALL-E error: {response.text}")
         
         data = response.json()
         images = []
+        writes = []
         image_path = None
         
+        stamp = _batch_stamp()
+        output_dir = self.generated_dir
+        
         for i, img_data in enumerate(data.get("data", [])):
-            img_bytes = base64.b64decode(img_data["b64_json"])
-            filename = f"dalle_{seed}_{i}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            filepath = self.generated_dir / filename
+            img_base64 = img_data["b64_json"]
+            img_bytes = base64.b64decode(img_base64)
+            filename = f"dalle_{seed}_{i}_{stamp}.png"
+            filepath = output_dir / filename
             
-            with open(filepath, 'wb') as f:
-                f.write(img_bytes)
+            writes.append(_io_pool.submit(_write_image, filepath, img_bytes))
             
+            relative_path = str(filepath.relative_to(self.media_root))
             if i == 0:
-                image_path = str(filepath.relative_to(self.media_root))
+                image_path = relative_path
             
             images.append({
-                'url': f'/media/{filepath.relative_to(self.media_root)}',
-                'base64': img_data["b64_json"]
+                'url': f'/media/{relative_path}',
+                'base64': img_base64
             })
         
+        _wait_for_writes(writes)
+        
         return {
             'images': images,
             'image_path': image_path,
@@ -198,114 +428,147 @@ class AIArtGenerator:
             "Content-Type": "application/json"
         }
         
-        body = {
-            "inputs": prompt,
-            "parameters": {
-                "negative_prompt": negative_prompt,
-                "width": min(width, 1024),
-                "height": min(height, 1024),
-                "num_inference_steps": min(steps, 50),
-                "guidance_scale": cfg_scale,
-                "seed": seed
+        stamp = _batch_stamp()
+        output_dir = self.generated_dir
+        
+        def fetch(i):
+            body = {
+                "inputs": prompt,
+                "parameters": {
+                    "negative_prompt": negative_prompt,
+                    "width": min(width, 1024),
+                    "height": min(height, 1024),
+                    "num_inference_steps": min(steps, 50),
+                    "guidance_scale": cfg_scale,
+                    "seed": seed + i
+                }
             }
-        }
-        
-        response = requests.post(url, headers=headers, json=body)
-        
-        if response.status_code != 200:
-            raise Exception(f"Hugging Face error: {response.text}")
-        
-        # Response is the image bytes directly
-        img_bytes = response.content
-        filename = f"hf_{seed}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        filepath = self.generated_dir / filename
+            filepath = output_dir / f"hf_{seed}_{i}_{stamp}.png"
+            
+            # Each image is its own upstream call, so each takes its own slot
+            with _provider_slots['huggingface'], _http.post(
+                url, headers=headers, json=body, stream=True, timeout=PROVIDER_TIMEOUT
+            ) as response:
+                if response.status_code != 200:
+                    raise Exception(f"Hugging Face error: {response.text}")
+                
+                # Response is the image bytes directly; copy it to disk chunk by
+                # chunk and base64 encode each chunk on the way through, carrying
+                # any bytes past a multiple of three over to the next one
+                encoded = []
+                carry = b''
+                with _open_output(filepath) as f:
+                    for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                        f.write(chunk)
+                        chunk = carry + chunk
+                        cut = len(chunk) - len(chunk) % 3
+                        encoded.append(base64.b64encode(chunk[:cut]))
+                        carry = chunk[cut:]
+                encoded.append(base64.b64encode(carry))
+            
+            return str(filepath.relative_to(self.media_root)), b''.join(encoded).decode('ascii')
         
-        with open(filepath, 'wb') as f:
-            f.write(img_bytes)
+        # The Inference API returns one image per call, so issue a request per
+        # image and let them wait on the network side by side, never more
+        # threads than the provider has slots
+        with ThreadPoolExecutor(max_workers=min(num_images, PROVIDER_CONCURRENCY)) as pool:
+            results = list(pool.map(fetch, range(num_images)))
         
-        img_base64 = base64.b64encode(img_bytes).decode('utf-8')
+        images = [{
+            'url': f'/media/{relative_path}',
+            'base64': img_base64
+        } for relative_path, img_base64 in results]
         
         return {
-            'images': [{
-                'url': f'/media/{filepath.relative_to(self.media_root)}',
-                'base64': img_base64
-            }],
-            'image_path': str(filepath.relative_to(self.media_root)),
+            'images': images,
+            'image_path': results[0][0],
             'seed': seed,
             'model': 'huggingface'
         }
     
-    def _generate_placeholder(self, prompt, width, height, seed, num_images):
+    def _generate_placeholder(self, prompt, width, height, seed, num_images, repeatable=False):
         """
         Generate placeholder images for demo/development
         Creates artistic gradient images with text overlay
         """
         
+        # Placeholders depend only on the seed and dimensions, so a repeat of
+        # an explicitly seeded request can reuse the files written last time.
+        # Only the paths are cached; the base64 is read back from disk
+        cache_key = PLACEHOLDER_KEY_PREFIX + hashlib.blake2b(
+            f"{seed}|{width}|{height}|{num_images}".encode(), digest_size=16
+        ).hexdigest()
+        if repeatable:
+            paths = cache.get(cache_key)
+            images = paths and self._load_images(paths)
+            if images:
+                return self._placeholder_result(images, paths[0], seed)
+        
         images = []
+        paths = []
+        writes = []
         image_path = None
         
-        # Use seed for reproducible colors
-        random.seed(seed)
+        # Use seed for reproducible colors and noise
+        rng = np.random.default_rng(seed)
+        
+        # Draw both gradient colors for every image up front. The gradient
+        # only depends on x + y, so blend one color per diagonal and gather
+        # those into the whole (num_images, height, width, 3) batch at once
+        color1 = rng.integers(50, 201, (num_images, 1, 3)).astype(np.float32)
+        color2 = rng.integers(50, 201, (num_images, 1, 3)).astype(np.float32)
+        ratio = (np.arange(width + height - 1, dtype=np.float32) / (width + height))[:, None]
+        ramps = (color1 * (1 - ratio) + color2 * ratio).astype(np.uint8)
+        diagonals = np.arange(height)[:, None] + np.arange(width)[None, :]
+        batch = ramps[:, diagonals]
+        
+        # Add some noise/texture for visual interest: shift a tenth of each
+        # image's pixels by the same random amount on every channel
+        area = width * height
+        idx = rng.integers(0, area, (num_images, area // 10))
+        idx += np.arange(num_images)[:, None] * area
+        idx = idx.ravel()
+        pixels = batch.reshape(-1, 3)
+        noise = rng.integers(-20, 21, (idx.size, 1), dtype=np.int16)
+        pixels[idx] = np.clip(pixels[idx].astype(np.int16) + noise, 0, 255).astype(np.uint8)
+        
+        stamp = _batch_stamp()
+        output_dir = self.generated_dir
         
         for i in range(num_images):
-            # Create a gradient image
-            img = Image.new('RGB', (width, height))
-            pixels = img.load()
-            
-            # Generate random colors based on seed
-            color1 = (
-                random.randint(50, 200),
-                random.randint(50, 200),
-                random.randint(50, 200)
-            )
-            color2 = (
-                random.randint(50, 200),
-                random.randint(50, 200),
-                random.randint(50, 200)
-            )
+            img = Image.fromarray(batch[i])
             
-            # Create gradient
-            for y in range(height):
-                for x in range(width):
-                    ratio = (x + y) / (width + height)
-                    r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                    g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                    b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                    pixels[x, y] = (r, g, b)
-            
-            # Add some noise/texture for visual interest
-            for _ in range(width * height // 10):
-                x = random.randint(0, width - 1)
-                y = random.randint(0, height - 1)
-                current = pixels[x, y]
-                noise = random.randint(-20, 20)
-                pixels[x, y] = (
-                    max(0, min(255, current[0] + noise)),
-                    max(0, min(255, current[1] + noise)),
-                    max(0, min(255, current[2] + noise))
-                )
-            
-            # Save image
+            # Save image, sharing the encoded PNG buffer between the file
+            # write and the base64 encoder instead of copying it out
             img_byte_arr = io.BytesIO()
-            img.save(img_byte_arr, format='PNG')
-            img_bytes = img_byte_arr.getvalue()
+            img.save(img_byte_arr, format='PNG', compress_level=self.placeholder_png_level)
+            img_bytes = img_byte_arr.getbuffer()
             
-            filename = f"placeholder_{seed}_{i}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            filepath = self.generated_dir / filename
+            filename = f"placeholder_{seed}_{i}_{stamp}.png"
+            filepath = output_dir / filename
             
-            with open(filepath, 'wb') as f:
-                f.write(img_bytes)
+            writes.append(_io_pool.submit(_write_image, filepath, img_bytes))
             
+            relative_path = str(filepath.relative_to(self.media_root))
             if i == 0:
-                image_path = str(filepath.relative_to(self.media_root))
+                image_path = relative_path
+            paths.append(relative_path)
             
-            img_base64 = base64.b64encode(img_bytes).decode('utf-8')
+            img_base64 = base64.b64encode(img_bytes).decode('ascii')
             
             images.append({
-                'url': f'/media/{filepath.relative_to(self.media_root)}',
+                'url': f'/media/{relative_path}',
                 'base64': img_base64
             })
         
+        _wait_for_writes(writes)
+        
+        if repeatable:
+            cache.set(cache_key, paths, PLACEHOLDER_CACHE_TIMEOUT)
+        return self._placeholder_result(images, image_path, seed)
+    
+    @staticmethod
+    def _placeholder_result(images, image_path, seed):
         return {
             'images': images,
             'image_path': image_path,
@@ -326,20 +589,7 @@ class AIArtGenerator:
             Enhanced prompt string
         """
         
-        style_modifiers = {
-            'photorealistic': 'photorealistic, highly detailed, 8k resolution, professional photography, dramatic lighting',
-            'artistic': 'artistic, oil painting style, masterpiece, vibrant colors, detailed brushwork',
-            'anime': 'anime style, detailed anime art, vibrant colors, dynamic pose, studio quality',
-            'digital_art': 'digital art, concept art, trending on artstation, highly detailed, vibrant',
-            'fantasy': 'fantasy art, magical, ethereal lighting, detailed environment, epic composition',
-            'cyberpunk': 'cyberpunk style, neon lights, futuristic, high tech, rain, night city',
-            'watercolor': 'watercolor painting, soft colors, artistic, delicate, flowing',
-            'sketch': 'pencil sketch, detailed linework, artistic, professional illustration',
-            'default': 'high quality, detailed, professional'
-        }
-        
-        modifier = style_modifiers.get(style, style_modifiers['default'])
-        return f"{prompt}, {modifier}"
+        return prompt + ', ' + STYLE_MODIFIERS.get(style, DEFAULT_STYLE_MODIFIER)
     
     def get_prompt_suggestions(self, category=None):
         """
@@ -349,48 +599,11 @@ class AIArtGenerator:
             category: Optional category to filter suggestions
         
         Returns:
-            List of prompt suggestions
+            Sequence of prompt suggestions
         """
         
-        suggestions = {
-            'landscape': [
-                "A serene mountain lake at sunset with snow-capped peaks reflecting in crystal clear water",
-                "Enchanted forest with bioluminescent plants and mystical creatures",
-                "Futuristic cityscape with flying vehicles and holographic advertisements",
-                "Underwater coral reef paradise with colorful fish and sunbeams"
-            ],
-            'portrait': [
-                "Elegant portrait of a mysterious figure in Renaissance style clothing",
-                "Cyberpunk character with neon hair and augmented reality glasses",
-                "Fantasy warrior princess with intricate armor and magical aura",
-                "Steampunk inventor surrounded by clockwork mechanisms"
-            ],
-            'abstract': [
-                "Swirling galaxies of color representing the human consciousness",
-                "Geometric patterns flowing like liquid metal in zero gravity",
-                "Emotional explosion of colors representing joy and creativity",
-                "Fractal patterns inspired by nature's mathematical beauty"
-            ],
-            'fantasy': [
-                "Ancient dragon perched atop a crystal mountain at twilight",
-                "Magical library with floating books and ethereal librarians",
-                "Enchanted castle in the clouds with rainbow bridges",
-                "Mythical phoenix rising from flames in a starlit sky"
-            ],
-            'scifi': [
-                "Space station orbiting a gas giant with multiple moons visible",
-                "Alien marketplace on a distant planet with exotic species",
-                "Time travel portal opening in a Victorian laboratory",
-                "Robot and human collaboration in a futuristic workshop"
-            ]
-        }
-        
-        if category and category in suggestions:
-            return suggestions[category]
+        if category and category in PROMPT_SUGGESTIONS:
+            return PROMPT_SUGGESTIONS[category]
         
         # Return a mix of all suggestions
-        all_suggestions = []
-        for cat_suggestions in suggestions.values():
-            all_suggestions.extend(cat_suggestions)
-        random.shuffle(all_suggestions)
-        return all_suggestions[:10]
+        return random.sample(ALL_PROMPT_SUGGESTIONS, 10)
@@ -0,0 +1,110 @@
+from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchVector
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from .cache_keys import CATEGORY_LIST_KEY, TAG_LIST_KEY, TAG_POPULAR_KEY
+from .models import UserProfile, Artwork, Bid, Category, Tag
+from .tasks import generate_thumbnails
+
+
+@receiver(post_save, sender=User)
+def create_user_profile(sender, instance, created, **kwargs):
+    """Every user gets a profile as soon as the account exists"""
+    if created:
+        UserProfile.objects.get_or_create(user=instance)
+
+
+@receiver(post_save, sender=Artwork)
+def mark_owner_as_artist(sender, instance, created, **kwargs):
+    """Flag the owner of a new or bought artwork so artists can be counted without a join"""
+    update_fields = kwargs.get('update_fields')
+    if created or (update_fields is not None and 'owner' in update_fields):
+        UserProfile.objects.filter(user_id=instance.owner_id, is_artist=False).update(is_artist=True)
+
+
+@receiver(post_save, sender=Bid)
+def update_highest_bid(sender, instance, created, **kwargs):
+    """Keep the denormalized highest bid on the artwork in sync"""
+    if not created:
+        return
+    Artwork.objects.filter(
+        Q(highest_bid_amount__lt=instance.amount) | Q(highest_bid_amount__isnull=True),
+        pk=instance.artwork_id
+    ).update(highest_bid_amount=instance.amount, highest_bidder_id=instance.bidder_id)
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_list(sender, **kwargs):
+    cache.delete(CATEGORY_LIST_KEY)
+
+
+@receiver([post_save, post_delete], sender=Artwork)
+def invalidate_artwork_counts(sender, instance, **kwargs):
+    """Drop cached category counts when an artwork may have changed category or status"""
+    if kwargs['signal'] is post_delete:
+        cache.delete_many([CATEGORY_LIST_KEY, TAG_LIST_KEY, TAG_POPULAR_KEY])
+        return
+    update_fields = kwargs.get('update_fields')
+    if update_fields is None or {'status', 'category'} & set(update_fields):
+        cache.delete(CATEGORY_LIST_KEY)
+
+
+# Weighted so title hits outrank prompt hits, which outrank description hits
+ARTWORK_SEARCH_VECTOR = (
+    SearchVector('title', weight='A') + SearchVector('prompt', weight='B') + SearchVector('description', weight='C')
+)
+ARTWORK_SEARCH_FIELDS = {'title', 'prompt', 'description'}
+
+
+@receiver(post_save, sender=Artwork)
+def update_search_vector(sender, instance, **kwargs):
+    """Recompute the full-text vector when searchable text may have changed"""
+    if connection.vendor != 'postgresql':
+        return
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not ARTWORK_SEARCH_FIELDS & set(update_fields):
+        return
+    Artwork.objects.filter(pk=instance.pk).update(search_vector=ARTWORK_SEARCH_VECTOR)
+
+
+@receiver([post_save, post_delete], sender=Tag)
+def invalidate_tag_list(sender, **kwargs):
+    cache.delete_many([TAG_LIST_KEY, TAG_POPULAR_KEY])
+
+
+@receiver(m2m_changed, sender=Artwork.tags.through)
+def invalidate_tag_counts(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        cache.delete_many([TAG_LIST_KEY, TAG_POPULAR_KEY])
+
+
+@receiver(pre_save, sender=Artwork)
+def clear_stale_thumbnails(sender, instance, **kwargs):
+    """Drop the thumbnails of a replaced image so they are rendered again"""
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and 'image' not in update_fields:
+        return
+    loaded = getattr(instance, '_loaded_image', None)
+    if loaded is None or loaded == instance.image.name:
+        return
+    stale = [(thumb.storage, thumb.name) for thumb in (instance.thumbnail, instance.thumbnail_small) if thumb]
+    instance.thumbnail = None
+    instance.thumbnail_small = None
+    if stale:
+        transaction.on_commit(lambda: [storage.delete(name) for storage, name in stale])
+
+
+@receiver(post_save, sender=Artwork)
+def queue_thumbnails(sender, instance, **kwargs):
+    """Render thumbnails off the request path once the artwork is committed"""
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and 'image' not in update_fields:
+        return
+    # The name as stored, now that the file field has saved any upload
+    instance._loaded_image = instance.image.name
+    if instance.image and not instance.thumbnail:
+        transaction.on_commit(lambda: generate_thumbnails.delay(str(instance.pk)))
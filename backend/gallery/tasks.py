@@ -0,0 +1,283 @@
+"""
+Background tasks for the gallery app
+Run by Celery workers (or inline when CELERY_TASK_ALWAYS_EAGER is set)
+"""
+
+import io
+import time
+from datetime import timedelta
+from pathlib import Path
+from PIL import Image
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .cache_keys import (
+    CATEGORY_LIST_KEY, ARTWORK_VIEWS_KEY, VIEW_FLUSH_INTERVAL, GENERATION_RESULT_KEY, GENERATION_RESULT_TIMEOUT, TRENDING_IDS_KEY, TRENDING_CACHE_TIMEOUT,
+)
+from .fees import platform_fee
+from .models import Artwork, AIGenerationTask, Bid, Notification, Transaction, UserProfile
+from .services import AIArtGenerator
+
+
+# Thumbnail field -> longest edge in pixels
+THUMBNAIL_SIZES = {
+    'thumbnail': 512,
+    'thumbnail_small': 256,
+}
+
+
+@shared_task
+def generate_thumbnails(artwork_id):
+    """Render WebP thumbnails for an artwork's image"""
+    try:
+        artwork = Artwork.objects.only('id', 'image', 'thumbnail', 'thumbnail_small').get(pk=artwork_id)
+    except Artwork.DoesNotExist:
+        return
+    
+    if not artwork.image:
+        return
+    
+    with artwork.image.open('rb') as f:
+        source = Image.open(f)
+        source.load()
+    source = source.convert('RGBA' if 'A' in source.getbands() else 'RGB')
+    
+    stem = Path(artwork.image.name).stem
+    for field, size in THUMBNAIL_SIZES.items():
+        thumb = source.copy()
+        thumb.thumbnail((size, size))
+        buffer = io.BytesIO()
+        thumb.save(buffer, format='WEBP', quality=80)
+        getattr(artwork, field).save(f'{stem}_{size}.webp', ContentFile(buffer.getvalue()), save=False)
+    
+    artwork.save(update_fields=list(THUMBNAIL_SIZES))
+
+
+@shared_task
+def run_generation(task_id, num_images=1):
+    """Run an AI generation task and record the outcome on it"""
+    try:
+        task = AIGenerationTask.objects.get(pk=task_id)
+    except AIGenerationTask.DoesNotExist:
+        return
+    
+    task.status = 'processing'
+    task.save(update_fields=['status'])
+    
+    try:
+        result = AIArtGenerator().generate(
+            prompt=task.prompt,
+            negative_prompt=task.negative_prompt,
+            width=task.width,
+            height=task.height,
+            steps=task.steps,
+            cfg_scale=task.cfg_scale,
+            seed=task.seed,
+            num_images=num_images
+        )
+    except Exception as e:
+        task.status = 'failed'
+        task.error_message = str(e)
+        task.save(update_fields=['status', 'error_message'])
+        return
+    
+    # Images (with their base64) are kept briefly for the client polling
+    # for them; store them before the task reads as completed
+    cache.set(GENERATION_RESULT_KEY.format(task.public_id), result['images'], GENERATION_RESULT_TIMEOUT)
+    
+    task.status = 'completed'
+    task.result_image = result['image_path']
+    task.seed = result['seed']
+    task.completed_at = timezone.now()
+    task.save(update_fields=['status', 'result_image', 'seed', 'completed_at'])
+
+
+@shared_task
+def recompute_trending():
+    """Store the ids of the week's 20 most liked published artworks"""
+    ids = [str(pk) for pk in Artwork.objects.filter(
+        status='published',
+        created_at__gte=timezone.now() - timedelta(days=7)
+    ).order_by('-likes_count', '-views').values_list('id', flat=True)[:20]]
+    cache.set(TRENDING_IDS_KEY, ids, TRENDING_CACHE_TIMEOUT)
+    return ids
+
+
+@shared_task
+def flush_views(artwork_id, key):
+    """Write a window's buffered views back to the artwork"""
+    count = cache.get(key)
+    if not count:
+        return
+    # Take off exactly what was read, so views counted in between stay
+    # buffered for the next flush; the drained key is left to expire
+    try:
+        cache.decr(key, count)
+    except ValueError:
+        return
+    Artwork.objects.filter(pk=artwork_id).update(views=F('views') + count)
+
+
+def record_view(artwork_id):
+    """
+    Count a view in the cache instead of the database
+    The first view of each window schedules the write-back for when it
+    closes, so N views cost one UPDATE per artwork per window
+    """
+    if settings.CELERY_TASK_ALWAYS_EAGER:
+        # Without a worker the flush would run immediately, so buffering
+        # would only add cache round trips to the single UPDATE
+        Artwork.objects.filter(pk=artwork_id).update(views=F('views') + 1)
+        return
+    
+    now = time.time()
+    window = int(now // VIEW_FLUSH_INTERVAL)
+    key = ARTWORK_VIEWS_KEY.format(artwork_id, window)
+    flush_at = (window + 1) * VIEW_FLUSH_INTERVAL + 1
+    if cache.add(key, 1, VIEW_FLUSH_INTERVAL * 10):
+        flush_views.apply_async((str(artwork_id), key), countdown=flush_at - now)
+        return
+    cache.incr(key)
+    if time.time() >= flush_at:
+        # Landed after the window's flush may already have run; schedule
+        # another so this view isn't left sitting in the cache
+        flush_views.delay(str(artwork_id), key)
+
+
+@shared_task
+def close_auctions():
+    """
+    Close every auction past its end time and notify the people involved
+    Won auctions are settled like a purchase: the winner pays the highest
+    bid, the seller is credited less the platform fee and ownership moves
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        expired = list(Artwork.objects.select_for_update(of=('self',)).filter(
+            is_auction=True, auction_end_time__lte=now, status='published'
+        ).select_related('highest_bidder').only(
+            'id', 'title', 'owner', 'status', 'is_auction', 'is_for_sale', 'updated_at',
+            'highest_bid_amount', 'highest_bidder__id', 'highest_bidder__username'
+        ))
+        if not expired:
+            return 0
+        
+        # Lock every wallet involved in user order, as purchase_artwork does;
+        # balances are then tracked here since one user may win or sell
+        # several of these auctions
+        user_ids = {artwork.owner_id for artwork in expired}
+        user_ids.update(artwork.highest_bidder_id for artwork in expired if artwork.highest_bidder_id)
+        profiles = {
+            profile.user_id: profile
+            for profile in UserProfile.objects.select_for_update().filter(
+                user_id__in=user_ids
+            ).order_by('user_id')
+        }
+        
+        losers = {}
+        for artwork_id, bidder_id in Bid.objects.filter(
+            artwork__in=expired
+        ).order_by().values_list('artwork_id', 'bidder_id').distinct():
+            losers.setdefault(artwork_id, []).append(bidder_id)
+        
+        notifications = []
+        transactions = []
+        settled = {}
+        for artwork in expired:
+            artwork.is_auction = False
+            artwork.updated_at = now
+            link = f'/artwork/{artwork.id}'
+            winner = artwork.highest_bidder
+            if winner is None:
+                notifications.append(Notification(
+                    user_id=artwork.owner_id,
+                    notification_type='system',
+                    title='Auction Ended',
+                    message=f'Your auction for "{artwork.title}" ended without any bids',
+                    link=link
+                ))
+                continue
+            
+            amount = artwork.highest_bid_amount
+            buyer = profiles[winner.id]
+            seller = profiles[artwork.owner_id]
+            if buyer.wallet_balance < amount:
+                # Not sold: the auction ends and the piece stays with its owner
+                notifications.append(Notification(
+                    user_id=winner.id,
+                    notification_type='system',
+                    title='Auction payment failed',
+                    message=f'Your ${amount} bid on "{artwork.title}" won, but your balance could not cover it',
+                    link=link
+                ))
+                notifications.append(Notification(
+                    user_id=artwork.owner_id,
+                    notification_type='system',
+                    title='Auction Ended',
+                    message=f'The winning bidder for "{artwork.title}" could not pay, so it was not sold',
+                    link=link
+                ))
+                continue
+            
+            fee = platform_fee(amount)
+            buyer.wallet_balance -= amount
+            buyer.is_artist = True
+            seller.wallet_balance += amount - fee
+            seller.total_sales += amount
+            settled[buyer.pk] = buyer
+            settled[seller.pk] = seller
+            
+            seller_id = artwork.owner_id
+            artwork.owner_id = winner.id
+            artwork.is_for_sale = False
+            artwork.status = 'sold'
+            transactions.append(Transaction(
+                transaction_type='bid_won',
+                buyer_id=winner.id,
+                seller_id=seller_id,
+                artwork=artwork,
+                amount=amount,
+                platform_fee=fee,
+                status='completed',
+                completed_at=now
+            ))
+            notifications.append(Notification(
+                user_id=winner.id,
+                notification_type='auction_won',
+                title='You won the auction!',
+                message=f'Your ${amount} bid on "{artwork.title}" won',
+                link=link
+            ))
+            notifications.append(Notification(
+                user_id=seller_id,
+                notification_type='sale',
+                title='Auction Sold!',
+                message=f'Your auction for "{artwork.title}" was won by {winner.username} for ${amount}',
+                link=link
+            ))
+            notifications.extend(Notification(
+                user_id=bidder_id,
+                notification_type='system',
+                title='Auction Ended',
+                message=f'The auction for "{artwork.title}" was won by another bidder',
+                link=link
+            ) for bidder_id in losers.get(artwork.id, ()) if bidder_id != winner.id)
+        
+        # bulk_update skips save() and its signals, so auto_now is set above
+        # and the category counts are dropped by hand
+        Artwork.objects.bulk_update(
+            expired, ['owner', 'status', 'is_auction', 'is_for_sale', 'updated_at'], batch_size=500
+        )
+        UserProfile.objects.bulk_update(
+            settled.values(), ['wallet_balance', 'total_sales', 'is_artist'], batch_size=500
+        )
+        Transaction.objects.bulk_create(transactions, batch_size=500)
+        Notification.objects.bulk_create(notifications, batch_size=500)
+    
+    cache.delete(CATEGORY_LIST_KEY)
+    return len(expired)
@@ -0,0 +1,97 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from gallery.models import Artwork, Bid, Notification, Transaction, UserProfile
+from gallery.tasks import close_auctions
+
+
+class CloseAuctionsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user('owner', password='pw')
+        self.bidder = User.objects.create_user('bidder', password='pw')
+        self.loser = User.objects.create_user('loser', password='pw')
+        UserProfile.objects.filter(user=self.bidder).update(wallet_balance=Decimal('50.00'))
+        past = timezone.now() - timedelta(minutes=1)
+        self.won = Artwork.objects.create(
+            title='Won', owner=self.owner, status='published', is_auction=True, is_for_sale=True,
+            price=Decimal('100.00'), auction_end_time=past
+        )
+        Bid.objects.create(artwork=self.won, bidder=self.loser, amount=Decimal('30.00'))
+        Bid.objects.create(artwork=self.won, bidder=self.loser, amount=Decimal('35.00'))
+        Bid.objects.create(artwork=self.won, bidder=self.bidder, amount=Decimal('42.99'), is_winning=True)
+        self.unsold = Artwork.objects.create(
+            title='Unsold', owner=self.owner, status='published', is_auction=True, auction_end_time=past
+        )
+        self.running = Artwork.objects.create(
+            title='Running', owner=self.owner, status='published', is_auction=True,
+            auction_end_time=timezone.now() + timedelta(hours=1)
+        )
+
+    def test_closes_only_expired_auctions(self):
+        self.assertEqual(close_auctions(), 2)
+
+        self.won.refresh_from_db()
+        self.unsold.refresh_from_db()
+        self.running.refresh_from_db()
+        self.assertEqual(
+            (self.won.status, self.won.is_auction, self.won.is_for_sale, self.won.owner_id),
+            ('sold', False, False, self.bidder.id)
+        )
+        self.assertEqual((self.unsold.status, self.unsold.is_auction), ('published', False))
+        self.assertEqual((self.running.status, self.running.is_auction), ('published', True))
+
+        # A second run finds nothing left to close
+        self.assertEqual(close_auctions(), 0)
+
+    def test_won_auction_is_settled_like_a_purchase(self):
+        close_auctions()
+
+        winner = UserProfile.objects.get(user=self.bidder)
+        seller = UserProfile.objects.get(user=self.owner)
+        self.assertEqual(winner.wallet_balance, Decimal('7.01'))
+        self.assertTrue(winner.is_artist)
+        # 5% of 42.99 rounds to 2.15; fee and payout add up to the bid
+        self.assertEqual(seller.wallet_balance, Decimal('40.84'))
+        self.assertEqual(seller.total_sales, Decimal('42.99'))
+
+        transaction = Transaction.objects.get()
+        self.assertEqual(
+            (transaction.transaction_type, transaction.buyer_id, transaction.seller_id, transaction.artwork_id),
+            ('bid_won', self.bidder.id, self.owner.id, self.won.pk)
+        )
+        self.assertEqual((transaction.amount, transaction.platform_fee), (Decimal('42.99'), Decimal('2.15')))
+        self.assertEqual(transaction.status, 'completed')
+
+    def test_winner_who_cannot_pay_does_not_get_the_artwork(self):
+        UserProfile.objects.filter(user=self.bidder).update(wallet_balance=Decimal('10.00'))
+        close_auctions()
+
+        self.won.refresh_from_db()
+        self.assertEqual(
+            (self.won.status, self.won.is_auction, self.won.owner_id), ('published', False, self.owner.id)
+        )
+        self.assertEqual(UserProfile.objects.get(user=self.bidder).wallet_balance, Decimal('10.00'))
+        self.assertEqual(UserProfile.objects.get(user=self.owner).wallet_balance, Decimal('0.00'))
+        self.assertFalse(Transaction.objects.exists())
+        self.assertFalse(Notification.objects.filter(notification_type__in=['auction_won', 'sale']).exists())
+
+    def test_notifies_winner_owner_and_losers(self):
+        close_auctions()
+
+        won = Notification.objects.get(user=self.bidder, notification_type='auction_won')
+        self.assertIn('$42.99', won.message)
+        self.assertEqual(won.link, f'/artwork/{self.won.pk}')
+        sale = Notification.objects.get(user=self.owner, notification_type='sale')
+        self.assertIn('bidder', sale.message)
+        ended = Notification.objects.get(user=self.owner, notification_type='system')
+        self.assertEqual(ended.link, f'/artwork/{self.unsold.pk}')
+        # One notice per losing bidder, however many bids they placed
+        lost = Notification.objects.get(user=self.loser)
+        self.assertEqual(lost.link, f'/artwork/{self.won.pk}')
+        self.assertEqual(Notification.objects.count(), 4)
@@ -0,0 +1,68 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from gallery.models import Artwork, Bid, Notification
+
+
+class PlaceBidTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user('owner', password='pw')
+        self.alice = User.objects.create_user('alice', password='pw')
+        self.bob = User.objects.create_user('bob', password='pw')
+        self.artwork = Artwork.objects.create(
+            title='Piece', owner=self.owner, status='published', is_auction=True,
+            minimum_bid=Decimal('5.00'), auction_end_time=timezone.now() + timedelta(days=1)
+        )
+        self.client = APIClient()
+        self.url = f'/api/marketplace/bid/{self.artwork.pk}/'
+
+    def bid(self, user, amount):
+        self.client.force_authenticate(user)
+        return self.client.post(self.url, {'amount': amount}, format='json')
+
+    def test_bids_keep_highest_bid_in_sync(self):
+        self.assertEqual(self.bid(self.alice, '10.00').status_code, 201)
+        self.artwork.refresh_from_db()
+        self.assertEqual(self.artwork.highest_bid_amount, Decimal('10.00'))
+        self.assertEqual(self.artwork.highest_bidder_id, self.alice.id)
+
+        self.assertEqual(self.bid(self.bob, '12.50').status_code, 201)
+        self.artwork.refresh_from_db()
+        self.assertEqual(self.artwork.highest_bid_amount, Decimal('12.50'))
+        self.assertEqual(self.artwork.highest_bidder_id, self.bob.id)
+        self.assertEqual(
+            list(Bid.objects.filter(is_winning=True).values_list('bidder_id', flat=True)), [self.bob.id]
+        )
+
+    def test_lower_bid_is_rejected(self):
+        self.bid(self.alice, '10.00')
+        self.assertEqual(self.bid(self.bob, '10.00').status_code, 400)
+        self.artwork.refresh_from_db()
+        self.assertEqual(self.artwork.highest_bidder_id, self.alice.id)
+
+    def test_a_smaller_bid_saved_later_does_not_lower_the_leader(self):
+        Bid.objects.create(artwork=self.artwork, bidder=self.alice, amount=Decimal('20.00'))
+        Bid.objects.create(artwork=self.artwork, bidder=self.bob, amount=Decimal('15.00'))
+        self.artwork.refresh_from_db()
+        self.assertEqual(self.artwork.highest_bid_amount, Decimal('20.00'))
+        self.assertEqual(self.artwork.highest_bidder_id, self.alice.id)
+
+    def test_outbid_user_is_notified(self):
+        self.bid(self.alice, '10.00')
+        self.bid(self.bob, '12.00')
+
+        self.assertEqual(Notification.objects.filter(user=self.owner, notification_type='bid').count(), 2)
+        self.assertEqual(Notification.objects.filter(user=self.alice, notification_type='outbid').count(), 1)
+        self.assertFalse(Notification.objects.filter(user=self.bob, notification_type='outbid').exists())
+
+    def test_raising_own_bid_sends_no_outbid(self):
+        self.bid(self.alice, '10.00')
+        self.bid(self.alice, '11.00')
+        self.assertFalse(Notification.objects.filter(notification_type='outbid').exists())
@@ -0,0 +1,60 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from gallery.models import Artwork
+
+
+class ArtworkConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.owner = User.objects.create_user('owner', password='pw')
+        self.artwork = Artwork.objects.create(title='Piece', owner=self.owner, status='published')
+        self.draft = Artwork.objects.create(title='Draft', owner=self.owner, status='draft')
+
+    def test_list_revalidates_until_payload_changes(self):
+        response = self.client.get('/api/artworks/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        response = self.client.get('/api/artworks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Views aren't in any timestamp but are part of the page
+        Artwork.objects.filter(pk=self.artwork.pk).update(views=10)
+        response = self.client.get('/api/artworks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_list_renders_the_page_once(self):
+        with mock.patch.object(JSONRenderer, 'render', autospec=True, side_effect=JSONRenderer.render) as render:
+            response = self.client.get('/api/artworks/', HTTP_ACCEPT='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(render.call_count, 1)
+
+    def test_detail_304_still_counts_view(self):
+        url = f'/api/artworks/{self.artwork.pk}/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.artwork.refresh_from_db()
+        self.assertEqual(self.artwork.views, 2)
+
+    def test_detail_hides_other_users_drafts(self):
+        url = f'/api/artworks/{self.draft.pk}/'
+        self.client.force_authenticate(self.owner)
+        etag = self.client.get(url)['ETag']
+
+        self.client.force_authenticate(User.objects.create_user('other', password='pw'))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('Last-Modified', response)
+        self.draft.refresh_from_db()
+        self.assertEqual(self.draft.views, 1)
@@ -0,0 +1,61 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+
+class BigintPrimaryKeyMigrationTests(TransactionTestCase):
+    """0005 rebuilds transactions and generation tasks with sequential keys"""
+
+    before = [('gallery', '0004_alter_notification_notification_type')]
+    after = [('gallery', '0005_bigint_pk_transaction_aigenerationtask')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_existing_rows_keep_their_uuid_and_order(self):
+        apps = self.migrate(self.before)
+        User = apps.get_model('auth', 'User')
+        Transaction = apps.get_model('gallery', 'Transaction')
+        AIGenerationTask = apps.get_model('gallery', 'AIGenerationTask')
+
+        user = User.objects.create(username='buyer')
+        now = timezone.now()
+        # Inserted newest first so the copy has to reorder them
+        transaction_ids = [uuid.uuid4(), uuid.uuid4()]
+        for offset, pk in zip((0, 1), transaction_ids):
+            transaction = Transaction.objects.create(
+                id=pk, transaction_type='purchase', buyer=user, amount=Decimal('9.99'),
+                platform_fee=Decimal('0.50'), status='completed'
+            )
+            Transaction.objects.filter(pk=transaction.pk).update(created_at=now - timedelta(days=offset))
+        AIGenerationTask.objects.create(user=user, prompt='a lake', status='completed', seed=7)
+        task_id, created_at = AIGenerationTask.objects.values_list('pk', 'created_at').get()
+
+        apps = self.migrate(self.after)
+        Transaction = apps.get_model('gallery', 'Transaction')
+        AIGenerationTask = apps.get_model('gallery', 'AIGenerationTask')
+
+        rows = list(Transaction.objects.order_by('id').values_list('public_id', 'buyer_id', 'amount', 'created_at'))
+        self.assertEqual([row[0] for row in rows], list(reversed(transaction_ids)))
+        self.assertEqual(rows[0][1:3], (user.pk, Decimal('9.99')))
+        self.assertLess(rows[0][3], rows[1][3])
+
+        task = AIGenerationTask.objects.get()
+        self.assertIsInstance(task.pk, int)
+        self.assertEqual((task.public_id, task.user_id, task.prompt, task.seed), (task_id, user.pk, 'a lake', 7))
+        self.assertEqual(task.created_at, created_at)
+
+        # New rows continue the sequence after the copied ones
+        Transaction.objects.create(transaction_type='deposit', amount=Decimal('1.00'))
+        self.assertEqual(Transaction.objects.count(), 3)
@@ -0,0 +1,67 @@
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from gallery.models import Artwork, Notification, Transaction, UserProfile
+
+
+class PurchaseArtworkTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.seller = User.objects.create_user('seller', password='pw')
+        self.buyer = User.objects.create_user('buyer', password='pw')
+        UserProfile.objects.filter(user=self.buyer).update(wallet_balance=Decimal('20.00'))
+        self.artwork = Artwork.objects.create(
+            title='Piece', owner=self.seller, status='published', is_for_sale=True, price=Decimal('9.99')
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.buyer)
+        self.url = f'/api/marketplace/purchase/{self.artwork.pk}/'
+
+    def test_purchase_moves_money_and_ownership(self):
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 200)
+
+        buyer = UserProfile.objects.get(user=self.buyer)
+        seller = UserProfile.objects.get(user=self.seller)
+        self.assertEqual(buyer.wallet_balance, Decimal('10.01'))
+        # 5% of 9.99 rounds to 0.50; fee and payout add up to the price
+        self.assertEqual(seller.wallet_balance, Decimal('9.49'))
+        self.assertEqual(seller.total_sales, Decimal('9.99'))
+        # Owning the artwork now counts the buyer as an artist
+        self.assertTrue(buyer.is_artist)
+
+        transaction = Transaction.objects.get(public_id=response.data['transaction_id'])
+        self.assertEqual(transaction.amount, Decimal('9.99'))
+        self.assertEqual(transaction.platform_fee, Decimal('0.50'))
+        self.assertEqual(transaction.seller_id, self.seller.id)
+        self.assertEqual(transaction.status, 'completed')
+
+        self.artwork.refresh_from_db()
+        self.assertEqual(self.artwork.owner_id, self.buyer.id)
+        self.assertEqual(self.artwork.status, 'sold')
+        self.assertFalse(self.artwork.is_for_sale)
+        self.assertTrue(Notification.objects.filter(user=self.seller, notification_type='sale').exists())
+
+    def test_sold_artwork_cannot_be_bought_twice(self):
+        self.assertEqual(self.client.post(self.url).status_code, 200)
+        other = User.objects.create_user('other', password='pw')
+        UserProfile.objects.filter(user=other).update(wallet_balance=Decimal('20.00'))
+        self.client.force_authenticate(other)
+
+        self.assertEqual(self.client.post(self.url).status_code, 400)
+        self.assertEqual(UserProfile.objects.get(user=other).wallet_balance, Decimal('20.00'))
+        self.assertEqual(Transaction.objects.count(), 1)
+
+    def test_insufficient_balance_changes_nothing(self):
+        UserProfile.objects.filter(user=self.buyer).update(wallet_balance=Decimal('5.00'))
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(UserProfile.objects.get(user=self.buyer).wallet_balance, Decimal('5.00'))
+        self.assertEqual(UserProfile.objects.get(user=self.seller).wallet_balance, Decimal('0.00'))
+        self.assertFalse(Transaction.objects.exists())
+        self.assertFalse(Notification.objects.exists())
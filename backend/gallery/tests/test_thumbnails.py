@@ -0,0 +1,67 @@
+import io
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from gallery.models import Artwork
+
+
+def png(name, color):
+    buffer = io.BytesIO()
+    Image.new('RGB', (600, 400), color).save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+class ThumbnailTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.owner = User.objects.create_user('owner', password='pw')
+
+    def create_artwork(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Artwork.objects.create(title='Piece', owner=self.owner, image=png('first.png', 'red'))
+
+    def test_replacing_image_regenerates_thumbnails(self):
+        self.create_artwork()
+        artwork = Artwork.objects.get()
+        old = [artwork.thumbnail.name, artwork.thumbnail_small.name]
+        self.assertIn('first', old[1])
+
+        artwork.image = png('second.png', 'blue')
+        with self.captureOnCommitCallbacks(execute=True):
+            artwork.save()
+        artwork.refresh_from_db()
+        self.assertIn('second', artwork.thumbnail.name)
+        self.assertIn('second', artwork.thumbnail_small.name)
+        # The replaced thumbnails are removed from storage
+        self.assertFalse(any(artwork.thumbnail.storage.exists(name) for name in old))
+
+    def test_saving_without_a_new_image_keeps_thumbnails(self):
+        self.create_artwork()
+        artwork = Artwork.objects.get()
+        artwork.title = 'Renamed'
+        # Only the UPDATE itself; the stored image isn't read back
+        with self.assertNumQueries(1), self.captureOnCommitCallbacks(execute=True):
+            artwork.save()
+        artwork.refresh_from_db()
+        self.assertIn('first', artwork.thumbnail.name)
+
+    def test_backfill_queues_only_missing(self):
+        done = self.create_artwork()
+        with mock.patch('gallery.signals.transaction.on_commit'):
+            missing = Artwork.objects.create(title='Old', owner=self.owner, image=png('old.png', 'green'))
+
+        with mock.patch('gallery.management.commands.backfill_thumbnails.generate_thumbnails.delay') as delay:
+            call_command('backfill_thumbnails', stdout=io.StringIO())
+        delay.assert_called_once_with(str(missing.pk))
+        self.assertNotEqual(done.pk, missing.pk)
@@ -0,0 +1,89 @@
+import time
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from gallery.cache_keys import VIEW_FLUSH_INTERVAL
+from gallery.models import Artwork
+from gallery.tasks import flush_views, record_view
+
+
+class RecordViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user('owner', password='pw')
+        self.artwork = Artwork.objects.create(title='Piece', owner=owner, status='published')
+        # Pin the clock to the start of a real window; the cache checks its
+        # expiry against the same clock
+        self.now = time.time() // VIEW_FLUSH_INTERVAL * VIEW_FLUSH_INTERVAL
+        clock = mock.patch('gallery.tasks.time.time', side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def views(self):
+        return Artwork.objects.values_list('views', flat=True).get(pk=self.artwork.pk)
+
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
+    def test_eager_writes_straight_through(self):
+        with mock.patch('gallery.tasks.flush_views.apply_async') as schedule:
+            record_view(self.artwork.pk)
+            record_view(self.artwork.pk)
+        schedule.assert_not_called()
+        self.assertEqual(self.views(), 2)
+
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=False)
+    def test_buffered_views_flush_once_per_window(self):
+        with mock.patch('gallery.tasks.flush_views.apply_async') as schedule:
+            for _ in range(5):
+                record_view(self.artwork.pk)
+
+        schedule.assert_called_once()
+        self.assertEqual(self.views(), 0)
+        flush_views(*schedule.call_args.args[0])
+        self.assertEqual(self.views(), 5)
+        # A second flush of the drained window must not count anything again
+        flush_views(*schedule.call_args.args[0])
+        self.assertEqual(self.views(), 5)
+
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=False)
+    def test_views_counted_during_flush_are_kept(self):
+        with mock.patch('gallery.tasks.flush_views.apply_async') as schedule:
+            record_view(self.artwork.pk)
+            record_view(self.artwork.pk)
+        args = schedule.call_args.args[0]
+
+        real_decr = cache.decr
+
+        def decr_with_straggler(key, delta):
+            # Another request counts a view between the read and the swap
+            cache.incr(key)
+            return real_decr(key, delta)
+
+        with mock.patch('gallery.tasks.cache.decr', side_effect=decr_with_straggler):
+            flush_views(*args)
+        self.assertEqual(self.views(), 2)
+
+        flush_views(*args)
+        self.assertEqual(self.views(), 3)
+
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=False)
+    def test_straggler_after_flush_schedules_another(self):
+        with mock.patch('gallery.tasks.flush_views.apply_async') as schedule:
+            record_view(self.artwork.pk)
+        flush_views(*schedule.call_args.args[0])
+
+        # Keyed to the old window, but counted after its flush time
+        real_incr = cache.incr
+
+        def slow_incr(key):
+            self.now += VIEW_FLUSH_INTERVAL + 5
+            return real_incr(key)
+
+        with mock.patch('gallery.tasks.cache.incr', side_effect=slow_incr), \
+                mock.patch('gallery.tasks.flush_views.delay') as reschedule:
+            record_view(self.artwork.pk)
+        reschedule.assert_called_once()
+        flush_views(*reschedule.call_args.args)
+        self.assertEqual(self.views(), 2)
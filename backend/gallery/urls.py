@@ -24,6 +24,7 @@ urlpatterns = [
     path('generate/', views.generate_art, name='generate-art'),
     path('generate/history/', views.generation_history, name='generation-history'),
     path('generate/save/', views.save_generated_art, name='save-generated-art'),
+    path('generate/<uuid:task_id>/', views.generation_status, name='generation-status'),
     
     # Marketplace endpoints
     path('marketplace/purchase/<uuid:artwork_id>/', views.purchase_artwork, name='purchase-artwork'),
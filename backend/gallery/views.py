@@ -2,14 +2,25 @@ from rest_framework import viewsets, generics, status, filters
 from rest_framework.decorators import api_view, permission_classes, action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, AllowAny
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from rest_framework.renderers import JSONRenderer
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate
-from django.db.models import Q, Count
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection, transaction as db_transaction
+from django.db.models import Q, F, Count, Exists, OuterRef, Prefetch
+from django.db.models.functions import Greatest
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django.utils import timezone
+from django.views.decorators.http import condition
 from decimal import Decimal
+import hashlib
 import random
 
 from .models import (
@@ -24,7 +35,13 @@ from .serializers import (
     NotificationSerializer, FollowSerializer, AIGenerationTaskSerializer,
     AIGenerationRequestSerializer
 )
-from .services import AIArtGenerator
+from .fees import platform_fee
+from .routers import READ_DB
+from .tasks import record_view, recompute_trending, run_generation
+from .cache_keys import (
+    CATEGORY_LIST_KEY, TAG_LIST_KEY, TAG_POPULAR_KEY, FEATURED_IDS_KEY, TRENDING_IDS_KEY, GENERATION_RESULT_KEY,
+    MARKETPLACE_STATS_KEY, LIST_CACHE_TIMEOUT, MARKETPLACE_STATS_TIMEOUT,
+)
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -33,6 +50,103 @@ class StandardResultsSetPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class FeedCursorPagination(CursorPagination):
+    page_size = 24
+    ordering = '-created_at'
+
+
+def annotate_is_liked(queryset, user):
+    """Annotate artworks with whether the given user has liked them"""
+    if user.is_authenticated:
+        return queryset.annotate(
+            is_liked=Exists(Like.objects.filter(artwork=OuterRef('pk'), user=user))
+        )
+    return queryset
+
+
+# Columns rendered by ArtworkListSerializer; everything else stays deferred
+ARTWORK_LIST_FIELDS = [
+    'id', 'title', 'image', 'thumbnail', 'image_url', 'price', 'is_for_sale',
+    'is_auction', 'owner', 'category', 'views', 'likes_count', 'created_at', 'ai_model',
+]
+
+# Columns of the joined category rendered by CategorySerializer
+ARTWORK_LIST_RELATED_FIELDS = [
+    'category__id', 'category__name', 'category__slug', 'category__description', 'category__icon',
+]
+
+# Owner columns rendered by UserSerializer, which keeps password hashes and
+# other auth_user columns out of list queries
+USER_FIELDS = ['id', 'username', 'email', 'first_name', 'last_name', 'date_joined']
+
+
+def artwork_list_queryset(queryset, user):
+    """Prepare an artwork queryset for ArtworkListSerializer"""
+    queryset = annotate_is_liked(queryset, user)
+    # Owners are prefetched with their counts annotated, one query for the
+    # whole page, instead of three COUNTs per artwork in UserSerializer
+    owners = annotate_user_counts(User.objects.only(*USER_FIELDS))
+    return queryset.select_related('category').only(
+        *ARTWORK_LIST_FIELDS, *ARTWORK_LIST_RELATED_FIELDS
+    ).prefetch_related(Prefetch('owner', queryset=owners))
+
+
+def artwork_etag(request, *parts):
+    """ETag for an artwork payload, scoped to the user since is_liked varies per user"""
+    raw = '|'.join(str(part) for part in (request.user.pk, *parts))
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def annotate_user_counts(queryset):
+    """Annotate users with follower, following and published artwork counts"""
+    return queryset.annotate(
+        followers_count=Count('followers', distinct=True),
+        following_count=Count('following', distinct=True),
+        artworks_count=Count('artworks', filter=Q(artworks__status='published'), distinct=True)
+    )
+
+
+def notify_followers(artwork):
+    """Notify everyone following the artwork's owner that it was published"""
+    follower_ids = Follow.objects.filter(followed_id=artwork.owner_id).values_list('follower_id', flat=True)
+    Notification.objects.bulk_create([
+        Notification(
+            user_id=follower_id,
+            notification_type='new_artwork',
+            title='New Artwork',
+            message=f'{artwork.owner.username} published "{artwork.title}"',
+            link=f'/artwork/{artwork.id}'
+        )
+        for follower_id in follower_ids.iterator()
+    ], batch_size=500)
+
+
+def collection_list_queryset(queryset):
+    """Prepare a collection queryset for CollectionSerializer"""
+    # A sliced Prefetch fetches at most four preview artworks per collection
+    preview = Artwork.objects.only('id', 'thumbnail_small')[:4]
+    return queryset.annotate(artworks_count=Count('artworks')).select_related('owner').prefetch_related(
+        Prefetch('artworks', queryset=preview, to_attr='prefetched_previews')
+    )
+
+
+def generation_payload(task):
+    """Response body describing where a generation task has got to"""
+    payload = {'task_id': str(task.public_id), 'status': task.status}
+    if task.status == 'completed':
+        images = cache.get(GENERATION_RESULT_KEY.format(task.public_id))
+        payload['images'] = images or [{'url': task.result_image.url}]
+        payload['seed'] = task.seed
+    elif task.status == 'failed':
+        payload['error'] = task.error_message
+    return payload
+
+
+def popular_tags_queryset():
+    """Tags ordered by how many artworks use them"""
+    return Tag.objects.annotate(count=Count('artworks')).order_by('-count')
+
+
 # ==================== AUTH VIEWS ====================
 
 @api_view(['POST'])
@@ -78,7 +192,7 @@ def login_user(request):
 def get_current_user(request):
     """Get current authenticated user details"""
     serializer = UserSerializer(request.user)
-    profile = UserProfile.objects.get_or_create(user=request.user)[0]
+    profile = request.user.profile
     return Response({
         'user': serializer.data,
         'profile': UserProfileSerializer(profile).data
@@ -89,7 +203,7 @@ def get_current_user(request):
 @permission_classes([IsAuthenticated])
 def update_profile(request):
     """Update user profile"""
-    profile, _ = UserProfile.objects.get_or_create(user=request.user)
+    profile = request.user.profile
     serializer = UserProfileSerializer(profile, data=request.data, partial=True)
     if serializer.is_valid():
         serializer.save()
@@ -165,16 +279,71 @@ class ArtworkViewSet(viewsets.ModelViewSet):
         if user_id:
             queryset = queryset.filter(owner_id=user_id)
         
-        return queryset.select_related('owner', 'category', 'creator').prefetch_related('tags')
+        if self.action == 'list':
+            return artwork_list_queryset(queryset, self.request.user).using(READ_DB)
+        
+        queryset = annotate_is_liked(queryset, self.request.user)
+        queryset = queryset.select_related('category').prefetch_related('tags').defer('search_vector')
+        if self.action == 'retrieve':
+            # Owner and creator carry UserSerializer's columns and counts; the
+            # highest bidder is only rendered by username
+            users = annotate_user_counts(User.objects.only(*USER_FIELDS))
+            return queryset.annotate(
+                comments_count=Count('comments', distinct=True)
+            ).prefetch_related(
+                Prefetch('owner', queryset=users),
+                Prefetch('creator', queryset=users),
+                Prefetch('highest_bidder', queryset=User.objects.only('id', 'username')),
+            )
+        return queryset.select_related('owner', 'creator')
     
     def perform_create(self, serializer):
-        serializer.save(owner=self.request.user, creator=self.request.user)
+        artwork = serializer.save(owner=self.request.user, creator=self.request.user)
+        if artwork.status == 'published':
+            notify_followers(artwork)
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.action != 'list' or response.status_code != 200:
+            return response
+        # The list ETag is taken over the rendered page, so anything the
+        # client sees (views, owner counts, tags) invalidates it without a
+        # second query. Rendering here is the only render: Django skips it
+        # for a response that is already rendered
+        response.render()
+        etag = quote_etag(hashlib.md5(response.content).hexdigest())
+        response['ETag'] = etag
+        return get_conditional_response(request, etag=etag, response=response)
     
     def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        instance.increment_views()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        # Views are deliberately left out of the ETag: every fetch bumps them,
+        # so including them would defeat revalidation entirely
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        try:
+            state = queryset.filter(pk=kwargs[self.lookup_field]).values_list(
+                'pk', 'updated_at', 'likes_count', 'highest_bid_amount', 'comments_count'
+            ).first()
+        except DjangoValidationError:
+            state = None
+        if state is None:
+            # Missing, malformed or not visible to this user
+            raise Http404
+        
+        # A revalidated fetch is still a view
+        record_view(state[0])
+        
+        def render(request, *args, **kwargs):
+            instance = self.get_object()
+            instance.views += 1
+            serializer = self.get_serializer(instance)
+            return Response(serializer.data)
+        
+        etag = artwork_etag(request, *state[1:])
+        respond = condition(
+            etag_func=lambda *a, **kw: etag,
+            last_modified_func=lambda *a, **kw: state[1]
+        )(render)
+        return respond(request, *args, **kwargs)
     
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated])
     def like(self, request, pk=None):
@@ -184,12 +353,14 @@ class ArtworkViewSet(viewsets.ModelViewSet):
         
         if not created:
             like.delete()
-            artwork.likes_count = max(0, artwork.likes_count - 1)
-            artwork.save()
+            Artwork.objects.filter(pk=artwork.pk).update(likes_count=Greatest(F('likes_count') - 1, 0))
+            artwork.refresh_from_db(fields=['likes_count'])
             return Response({'liked': False, 'likes_count': artwork.likes_count})
         
-        artwork.likes_count += 1
-        artwork.save()
+        # Single-column UPDATE in the database so concurrent likes can't
+        # overwrite each other's counts
+        Artwork.objects.filter(pk=artwork.pk).update(likes_count=F('likes_count') + 1)
+        artwork.refresh_from_db(fields=['likes_count'])
         
         # Create notification for artwork owner
         if artwork.owner != request.user:
@@ -206,20 +377,34 @@ class ArtworkViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def trending(self, request):
         """Get trending artworks"""
-        artworks = Artwork.objects.filter(
-            status='published',
-            created_at__gte=timezone.now() - timezone.timedelta(days=7)
-        ).order_by('-likes_count', '-views')[:20]
+        # The ranking is refreshed by celery beat; compute it here only when
+        # the cached list is missing (e.g. no beat running in development)
+        ids = cache.get(TRENDING_IDS_KEY)
+        if ids is None:
+            ids = recompute_trending()
+        artworks = artwork_list_queryset(
+            Artwork.objects.using(READ_DB).filter(id__in=ids, status='published'), request.user
+        )
+        position = {pk: index for index, pk in enumerate(ids)}
+        artworks = sorted(artworks, key=lambda artwork: position[str(artwork.pk)])
         serializer = ArtworkListSerializer(artworks, many=True, context={'request': request})
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """Get featured artworks (curated selection)"""
-        artworks = Artwork.objects.filter(
+        eligible = Artwork.objects.using(READ_DB).filter(
             status='published',
             likes_count__gte=10
-        ).order_by('?')[:12]
+        )
+        # Sample from a cached id list instead of ORDER BY RANDOM() over
+        # every eligible row; the filter is repeated so stale ids drop out
+        eligible_ids = cache.get_or_set(
+            FEATURED_IDS_KEY, lambda: list(eligible.values_list('id', flat=True)), LIST_CACHE_TIMEOUT
+        )
+        sample = random.sample(eligible_ids, min(12, len(eligible_ids)))
+        artworks = list(artwork_list_queryset(eligible.filter(id__in=sample), request.user))
+        random.shuffle(artworks)
         serializer = ArtworkListSerializer(artworks, many=True, context={'request': request})
         return Response(serializer.data)
     
@@ -227,6 +412,7 @@ class ArtworkViewSet(viewsets.ModelViewSet):
     def my_artworks(self, request):
         """Get current user's artworks"""
         artworks = Artwork.objects.filter(owner=request.user).order_by('-created_at')
+        artworks = artwork_list_queryset(artworks, request.user)
         page = self.paginate_queryset(artworks)
         serializer = ArtworkListSerializer(page, many=True, context={'request': request})
         return self.get_paginated_response(serializer.data)
@@ -234,18 +420,42 @@ class ArtworkViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
     def feed(self, request):
         """Get personalized feed based on followed users"""
-        following_ids = Follow.objects.filter(
-            follower=request.user
-        ).values_list('followed_id', flat=True)
+        # A correlated EXISTS lets the planner semi-join against follows
+        # instead of building an IN list of every followed user
+        followed = Follow.objects.filter(follower=request.user, followed=OuterRef('owner_id'))
         
         artworks = Artwork.objects.filter(
-            owner_id__in=following_ids,
+            Exists(followed),
             status='published'
-        ).order_by('-created_at')
+        )
+        artworks = artwork_list_queryset(artworks, request.user)
         
-        page = self.paginate_queryset(artworks)
+        # Cursor pagination keeps deep pages cheap (no OFFSET scan)
+        paginator = FeedCursorPagination()
+        page = paginator.paginate_queryset(artworks, request, view=self)
         serializer = ArtworkListSerializer(page, many=True, context={'request': request})
-        return self.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response(serializer.data)
+    
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def export(self, request):
+        """Stream all of the current user's artworks as newline-delimited JSON"""
+        # Every row shares the same owner and one of a handful of categories,
+        # so load those (with their counts) once instead of per row
+        owner = annotate_user_counts(User.objects.filter(pk=request.user.pk)).get()
+        categories = {c.pk: c for c in CategoryViewSet.queryset.all()}
+        artworks = annotate_is_liked(Artwork.objects.filter(owner=request.user), request.user)
+        artworks = artworks.only(*ARTWORK_LIST_FIELDS).order_by('-created_at')
+        
+        serializer = ArtworkListSerializer(context={'request': request})
+        renderer = JSONRenderer()
+        
+        def rows():
+            for artwork in artworks.iterator(chunk_size=200):
+                artwork.owner = owner
+                artwork.category = categories.get(artwork.category_id)
+                yield renderer.render(serializer.to_representation(artwork)) + b'\n'
+        
+        return StreamingHttpResponse(rows(), content_type='application/x-ndjson')
 
 
 # ==================== AI GENERATION VIEWS ====================
@@ -274,49 +484,32 @@ def generate_art(request):
         status='pending'
     )
     
-    # Generate art using AI service
-    try:
-        generator = AIArtGenerator()
-        result = generator.generate(
-            prompt=data['prompt'],
-            negative_prompt=data.get('negative_prompt', ''),
-            width=data.get('width', 512),
-            height=data.get('height', 512),
-            steps=data.get('steps', 50),
-            cfg_scale=data.get('cfg_scale', 7.5),
-            seed=data.get('seed'),
-            num_images=data.get('num_images', 1)
-        )
-        
-        task.status = 'completed'
-        task.result_image = result['image_path']
-        task.seed = result['seed']
-        task.completed_at = timezone.now()
-        task.save()
-        
-        return Response({
-            'task_id': str(task.id),
-            'status': 'completed',
-            'images': result['images'],
-            'seed': result['seed']
-        })
-        
-    except Exception as e:
-        task.status = 'failed'
-        task.error_message = str(e)
-        task.save()
-        return Response({
-            'task_id': str(task.id),
-            'status': 'failed',
-            'error': str(e)
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    # Generation runs on a Celery worker; when tasks run inline (no broker)
+    # it has already finished by the time delay() returns
+    run_generation.delay(task.pk, data.get('num_images', 1))
+    task.refresh_from_db(fields=['status', 'result_image', 'seed', 'error_message'])
+    
+    payload = generation_payload(task)
+    if task.status == 'failed':
+        return Response(payload, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    if task.status == 'completed':
+        return Response(payload)
+    return Response(payload, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def generation_status(request, task_id):
+    """Poll a generation task started by generate_art"""
+    task = get_object_or_404(AIGenerationTask, public_id=task_id, user=request.user)
+    return Response(generation_payload(task))
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def generation_history(request):
     """Get user's generation history"""
-    tasks = AIGenerationTask.objects.filter(user=request.user).order_by('-created_at')[:50]
+    tasks = AIGenerationTask.objects.using(READ_DB).filter(user=request.user).order_by('-created_at')[:50]
     serializer = AIGenerationTaskSerializer(tasks, many=True)
     return Response(serializer.data)
 
@@ -332,8 +525,8 @@ def save_generated_art(request):
     price = request.data.get('price', 0)
     
     try:
-        task = AIGenerationTask.objects.get(id=task_id, user=request.user)
-    except AIGenerationTask.DoesNotExist:
+        task = AIGenerationTask.objects.get(public_id=task_id, user=request.user)
+    except (AIGenerationTask.DoesNotExist, DjangoValidationError):
         return Response({'error': 'Generation task not found'}, status=status.HTTP_404_NOT_FOUND)
     
     if task.status != 'completed' or not task.result_image:
@@ -357,6 +550,7 @@ def save_generated_art(request):
         price=Decimal(str(price)),
         status='published'
     )
+    notify_followers(artwork)
     
     return Response(ArtworkDetailSerializer(artwork, context={'request': request}).data, status=status.HTTP_201_CREATED)
 
@@ -370,10 +564,18 @@ class CommentViewSet(viewsets.ModelViewSet):
     pagination_class = StandardResultsSetPagination
     
     def get_queryset(self):
+        # Users come with their counts annotated so the nested UserSerializer
+        # doesn't run three COUNT queries for every comment and reply
+        users = Prefetch('user', queryset=annotate_user_counts(User.objects.all()))
+        queryset = Comment.objects.filter(parent=None).prefetch_related(
+            users,
+            Prefetch('replies', queryset=Comment.objects.prefetch_related(users).order_by('-created_at'),
+                     to_attr='prefetched_replies')
+        )
         artwork_id = self.request.query_params.get('artwork')
         if artwork_id:
-            return Comment.objects.filter(artwork_id=artwork_id, parent=None)
-        return Comment.objects.filter(parent=None)
+            return queryset.filter(artwork_id=artwork_id)
+        return queryset
     
     def perform_create(self, serializer):
         comment = serializer.save(user=self.request.user)
@@ -398,11 +600,12 @@ class CollectionViewSet(viewsets.ModelViewSet):
     pagination_class = StandardResultsSetPagination
     
     def get_queryset(self):
+        queryset = collection_list_queryset(Collection.objects.all())
         if self.request.user.is_authenticated:
-            return Collection.objects.filter(
+            return queryset.filter(
                 Q(is_public=True) | Q(owner=self.request.user)
             )
-        return Collection.objects.filter(is_public=True)
+        return queryset.filter(is_public=True)
     
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
@@ -444,66 +647,75 @@ class CollectionViewSet(viewsets.ModelViewSet):
 @permission_classes([IsAuthenticated])
 def purchase_artwork(request, artwork_id):
     """Purchase an artwork"""
-    try:
-        artwork = Artwork.objects.get(id=artwork_id)
-    except Artwork.DoesNotExist:
-        return Response({'error': 'Artwork not found'}, status=status.HTTP_404_NOT_FOUND)
-    
-    if not artwork.is_for_sale:
-        return Response({'error': 'Artwork is not for sale'}, status=status.HTTP_400_BAD_REQUEST)
-    
-    if artwork.owner == request.user:
-        return Response({'error': 'Cannot purchase your own artwork'}, status=status.HTTP_400_BAD_REQUEST)
-    
-    buyer_profile = UserProfile.objects.get_or_create(user=request.user)[0]
-    seller_profile = UserProfile.objects.get_or_create(user=artwork.owner)[0]
-    
-    if buyer_profile.wallet_balance < artwork.price:
-        return Response({'error': 'Insufficient balance'}, status=status.HTTP_400_BAD_REQUEST)
-    
-    # Calculate platform fee (5%)
-    platform_fee = artwork.price * Decimal('0.05')
-    seller_amount = artwork.price - platform_fee
-    
-    # Process transaction
-    buyer_profile.wallet_balance -= artwork.price
-    buyer_profile.save()
-    
-    seller_profile.wallet_balance += seller_amount
-    seller_profile.total_sales += artwork.price
-    seller_profile.save()
-    
-    # Update artwork ownership
-    old_owner = artwork.owner
-    artwork.owner = request.user
-    artwork.is_for_sale = False
-    artwork.status = 'sold'
-    artwork.save()
-    
-    # Create transaction record
-    transaction = Transaction.objects.create(
-        transaction_type='purchase',
-        buyer=request.user,
-        seller=old_owner,
-        artwork=artwork,
-        amount=artwork.price,
-        platform_fee=platform_fee,
-        status='completed',
-        completed_at=timezone.now()
-    )
-    
-    # Notify seller
-    Notification.objects.create(
-        user=old_owner,
-        notification_type='sale',
-        title='Artwork Sold!',
-        message=f'Your artwork "{artwork.title}" was purchased by {request.user.username} for ${artwork.price}',
-        link=f'/artwork/{artwork.id}'
-    )
+    with db_transaction.atomic():
+        # Lock the artwork, then both wallets in user order, so concurrent
+        # purchases of the same piece or from the same wallet run one at a time
+        try:
+            artwork = Artwork.objects.select_for_update().get(id=artwork_id)
+        except Artwork.DoesNotExist:
+            return Response({'error': 'Artwork not found'}, status=status.HTTP_404_NOT_FOUND)
+        
+        if not artwork.is_for_sale:
+            return Response({'error': 'Artwork is not for sale'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        if artwork.owner_id == request.user.id:
+            return Response({'error': 'Cannot purchase your own artwork'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        profiles = {
+            profile.user_id: profile
+            for profile in UserProfile.objects.select_for_update().filter(
+                user_id__in=[request.user.id, artwork.owner_id]
+            ).order_by('user_id')
+        }
+        buyer_profile = profiles[request.user.id]
+        seller_profile = profiles[artwork.owner_id]
+        
+        if buyer_profile.wallet_balance < artwork.price:
+            return Response({'error': 'Insufficient balance'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        fee = platform_fee(artwork.price)
+        seller_amount = artwork.price - fee
+        
+        # Process transaction, computing the new balances in the database
+        UserProfile.objects.filter(pk=buyer_profile.pk).update(
+            wallet_balance=F('wallet_balance') - artwork.price
+        )
+        UserProfile.objects.filter(pk=seller_profile.pk).update(
+            wallet_balance=F('wallet_balance') + seller_amount,
+            total_sales=F('total_sales') + artwork.price
+        )
+        
+        # Update artwork ownership
+        old_owner_id = artwork.owner_id
+        artwork.owner = request.user
+        artwork.is_for_sale = False
+        artwork.status = 'sold'
+        artwork.save(update_fields=['owner', 'is_for_sale', 'status', 'updated_at'])
+        
+        # Create transaction record
+        transaction = Transaction.objects.create(
+            transaction_type='purchase',
+            buyer=request.user,
+            seller_id=old_owner_id,
+            artwork=artwork,
+            amount=artwork.price,
+            platform_fee=fee,
+            status='completed',
+            completed_at=timezone.now()
+        )
+        
+        # Notify seller
+        Notification.objects.create(
+            user_id=old_owner_id,
+            notification_type='sale',
+            title='Artwork Sold!',
+            message=f'Your artwork "{artwork.title}" was purchased by {request.user.username} for ${artwork.price}',
+            link=f'/artwork/{artwork.id}'
+        )
     
     return Response({
         'success': True,
-        'transaction_id': str(transaction.id),
+        'transaction_id': str(transaction.public_id),
         'message': f'Successfully purchased "{artwork.title}"'
     })
 
@@ -527,38 +739,40 @@ def place_bid(request, artwork_id):
     if artwork.auction_end_time and artwork.auction_end_time < timezone.now():
         return Response({'error': 'Auction has ended'}, status=status.HTTP_400_BAD_REQUEST)
     
-    # Mark previous winning bid as not winning
-    Bid.objects.filter(artwork=artwork, is_winning=True).update(is_winning=False)
-    
-    # Create new bid
-    bid = Bid.objects.create(
-        artwork=artwork,
-        bidder=request.user,
-        amount=amount,
-        is_winning=True
-    )
-    
-    # Notify artwork owner
-    Notification.objects.create(
-        user=artwork.owner,
-        notification_type='bid',
-        title='New Bid!',
-        message=f'{request.user.username} placed a ${amount} bid on "{artwork.title}"',
-        link=f'/artwork/{artwork.id}'
-    )
-    
-    # Notify previous highest bidder
-    previous_bids = Bid.objects.filter(artwork=artwork).exclude(bidder=request.user).order_by('-amount')
-    if previous_bids.exists():
-        previous_bidder = previous_bids.first().bidder
-        if previous_bidder != artwork.owner:
-            Notification.objects.create(
-                user=previous_bidder,
+    with db_transaction.atomic():
+        # Mark previous winning bid as not winning
+        Bid.objects.filter(artwork=artwork, is_winning=True).update(is_winning=False)
+        
+        # Create new bid
+        bid = Bid.objects.create(
+            artwork=artwork,
+            bidder=request.user,
+            amount=amount,
+            is_winning=True
+        )
+        
+        # Notify artwork owner
+        notifications = [Notification(
+            user_id=artwork.owner_id,
+            notification_type='bid',
+            title='New Bid!',
+            message=f'{request.user.username} placed a ${amount} bid on "{artwork.title}"',
+            link=f'/artwork/{artwork.id}'
+        )]
+        
+        # Notify previous highest bidder; the artwork was loaded before this
+        # bid, so its denormalized leader is still the one being outbid
+        previous_bidder_id = artwork.highest_bidder_id
+        if previous_bidder_id not in (None, request.user.id, artwork.owner_id):
+            notifications.append(Notification(
+                user_id=previous_bidder_id,
                 notification_type='outbid',
                 title='You have been outbid!',
                 message=f'Someone placed a higher bid on "{artwork.title}"',
                 link=f'/artwork/{artwork.id}'
-            )
+            ))
+        
+        Notification.objects.bulk_create(notifications)
     
     return Response(BidSerializer(bid).data, status=status.HTTP_201_CREATED)
 
@@ -569,6 +783,8 @@ def my_transactions(request):
     """Get user's transaction history"""
     transactions = Transaction.objects.filter(
         Q(buyer=request.user) | Q(seller=request.user)
+    ).select_related(
+        'buyer', 'seller', 'artwork__owner', 'artwork__category'
     ).order_by('-created_at')[:50]
     serializer = TransactionSerializer(transactions, many=True)
     return Response(serializer.data)
@@ -578,7 +794,7 @@ def my_transactions(request):
 
 class UserViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for viewing users"""
-    queryset = User.objects.all()
+    queryset = annotate_user_counts(User.objects.all())
     serializer_class = UserSerializer
     pagination_class = StandardResultsSetPagination
     filter_backends = [filters.SearchFilter]
@@ -588,7 +804,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     def profile(self, request, pk=None):
         """Get user profile with stats"""
         user = self.get_object()
-        profile = UserProfile.objects.get_or_create(user=user)[0]
+        profile = user.profile
         
         is_following = False
         if request.user.is_authenticated:
@@ -607,6 +823,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
         """Get user's public artworks"""
         user = self.get_object()
         artworks = Artwork.objects.filter(owner=user, status='published')
+        artworks = artwork_list_queryset(artworks, request.user)
         page = self.paginate_queryset(artworks)
         serializer = ArtworkListSerializer(page, many=True, context={'request': request})
         return self.get_paginated_response(serializer.data)
@@ -644,23 +861,55 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
 
 class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for categories"""
-    queryset = Category.objects.all()
+    queryset = Category.objects.annotate(
+        artworks_count=Count('artworks', filter=Q(artworks__status='published'))
+    )
     serializer_class = CategorySerializer
     lookup_field = 'slug'
+    
+    def list(self, request, *args, **kwargs):
+        # Only the plain first page is cached; filtered/paged requests go to the DB
+        if request.query_params:
+            return super().list(request, *args, **kwargs)
+        data = cache.get_or_set(
+            CATEGORY_LIST_KEY,
+            lambda: super(CategoryViewSet, self).list(request, *args, **kwargs).data,
+            LIST_CACHE_TIMEOUT
+        )
+        return Response(data)
 
 
 class TagViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for tags"""
-    queryset = Tag.objects.annotate(count=Count('artworks')).order_by('-count')
+    queryset = Tag.objects.all()
     serializer_class = TagSerializer
     lookup_field = 'slug'
     
+    def get_queryset(self):
+        # Only listings are ordered by usage; slug lookups skip the GROUP BY
+        if self.action == 'list':
+            return popular_tags_queryset()
+        return super().get_queryset()
+    
+    def list(self, request, *args, **kwargs):
+        if request.query_params:
+            return super().list(request, *args, **kwargs)
+        data = cache.get_or_set(
+            TAG_LIST_KEY,
+            lambda: super(TagViewSet, self).list(request, *args, **kwargs).data,
+            LIST_CACHE_TIMEOUT
+        )
+        return Response(data)
+    
     @action(detail=False, methods=['get'])
     def popular(self, request):
         """Get popular tags"""
-        tags = Tag.objects.annotate(count=Count('artworks')).order_by('-count')[:20]
-        serializer = TagSerializer(tags, many=True)
-        return Response(serializer.data)
+        data = cache.get_or_set(
+            TAG_POPULAR_KEY,
+            lambda: TagSerializer(popular_tags_queryset()[:20], many=True).data,
+            LIST_CACHE_TIMEOUT
+        )
+        return Response(data)
 
 
 # ==================== NOTIFICATION VIEWS ====================
@@ -669,8 +918,13 @@ class TagViewSet(viewsets.ReadOnlyModelViewSet):
 @permission_classes([IsAuthenticated])
 def get_notifications(request):
     """Get user notifications"""
-    notifications = Notification.objects.filter(user=request.user)[:50]
-    unread_count = notifications.filter(is_read=False).count()
+    user_notifications = Notification.objects.using(READ_DB).filter(user=request.user)
+    notifications = user_notifications.only(
+        'id', 'notification_type', 'title', 'message', 'link', 'is_read', 'created_at'
+    )[:50]
+    # Counted over all of the user's notifications (not just the page) by
+    # the (user, is_read) index
+    unread_count = user_notifications.filter(is_read=False).count()
     serializer = NotificationSerializer(notifications, many=True)
     return Response({
         'notifications': serializer.data,
@@ -685,7 +939,7 @@ def mark_notification_read(request, notification_id):
     try:
         notification = Notification.objects.get(id=notification_id, user=request.user)
         notification.is_read = True
-        notification.save()
+        notification.save(update_fields=['is_read'])
         return Response({'success': True})
     except Notification.DoesNotExist:
         return Response({'error': 'Notification not found'}, status=status.HTTP_404_NOT_FOUND)
@@ -710,29 +964,42 @@ def search(request):
     results = {}
     
     if search_type in ['all', 'artworks']:
-        artworks = Artwork.objects.filter(
-            Q(title__icontains=query) | 
-            Q(description__icontains=query) |
-            Q(prompt__icontains=query) |
-            Q(tags__name__icontains=query),
-            status='published'
-        ).distinct()[:20]
+        if query.strip() and connection.vendor == 'postgresql':
+            # Ranked full-text match against the GIN-indexed search vector;
+            # tag names are a small table and keep their substring match
+            search_query = SearchQuery(query, search_type='websearch')
+            tagged = Artwork.tags.through.objects.filter(artwork_id=OuterRef('pk'), tag__name__icontains=query)
+            artworks = Artwork.objects.using(READ_DB).filter(
+                Q(search_vector=search_query) | Exists(tagged),
+                status='published'
+            ).annotate(rank=SearchRank(F('search_vector'), search_query)).order_by('-rank', '-created_at')
+        else:
+            artworks = Artwork.objects.using(READ_DB).filter(
+                Q(title__icontains=query) | 
+                Q(description__icontains=query) |
+                Q(prompt__icontains=query) |
+                Q(tags__name__icontains=query),
+                status='published'
+            ).distinct()
+        artworks = artwork_list_queryset(artworks, request.user)[:20]
         results['artworks'] = ArtworkListSerializer(artworks, many=True, context={'request': request}).data
     
     if search_type in ['all', 'users']:
-        users = User.objects.filter(
+        users = User.objects.using(READ_DB).filter(
             Q(username__icontains=query) |
             Q(first_name__icontains=query) |
             Q(last_name__icontains=query)
-        )[:10]
+        )
+        users = annotate_user_counts(users)[:10]
         results['users'] = UserSerializer(users, many=True).data
     
     if search_type in ['all', 'collections']:
-        collections = Collection.objects.filter(
+        collections = Collection.objects.using(READ_DB).filter(
             Q(name__icontains=query) |
             Q(description__icontains=query),
             is_public=True
-        )[:10]
+        )
+        collections = collection_list_queryset(collections)[:10]
         results['collections'] = CollectionSerializer(collections, many=True).data
     
     return Response(results)
@@ -743,18 +1010,24 @@ def search(request):
 @api_view(['GET'])
 def marketplace_stats(request):
     """Get marketplace statistics"""
-    total_artworks = Artwork.objects.filter(status='published').count()
-    total_artists = User.objects.filter(artworks__isnull=False).distinct().count()
-    total_sales = Transaction.objects.filter(status='completed').count()
+    # The headline counts are allowed to lag by up to a minute
+    stats = cache.get(MARKETPLACE_STATS_KEY)
+    if stats is None:
+        stats = {
+            'total_artworks': Artwork.objects.using(READ_DB).filter(status='published').count(),
+            'total_artists': UserProfile.objects.using(READ_DB).filter(is_artist=True).count(),
+            'total_sales': Transaction.objects.using(READ_DB).filter(status='completed').count(),
+        }
+        cache.set(MARKETPLACE_STATS_KEY, stats, MARKETPLACE_STATS_TIMEOUT)
     
     # Get recent sales
-    recent_transactions = Transaction.objects.filter(
+    recent_transactions = Transaction.objects.using(READ_DB).filter(
         status='completed'
+    ).select_related(
+        'buyer', 'seller', 'artwork__owner', 'artwork__category'
     ).order_by('-created_at')[:5]
     
     return Response({
-        'total_artworks': total_artworks,
-        'total_artists': total_artists,
-        'total_sales': total_sales,
+        **stats,
         'recent_sales': TransactionSerializer(recent_transactions, many=True).data
     })
@@ -1,4 +1,4 @@
-import React, { useState } from 'react'
+import React, { useEffect, useRef, useState } from 'react'
 import { motion } from 'framer-motion'
 import { generateAPI, artworksAPI } from '../services/api'
 import { useGenerationStore } from '../store'
@@ -41,6 +41,10 @@ const PROMPT_SUGGESTIONS = [
   "Steampunk inventor's workshop with clockwork mechanisms",
 ]
 
+// How often to check on a queued generation, and when to stop waiting for it
+const POLL_INTERVAL_MS = 2000
+const POLL_TIMEOUT_MS = 3 * 60 * 1000
+
 export default function Generate() {
   const { settings, updateSettings, isGenerating, setGenerating, generatedImages, setGeneratedImages } = useGenerationStore()
   
@@ -50,6 +54,9 @@ export default function Generate() {
   const [selectedStyle, setSelectedStyle] = useState(null)
   const [saveModalOpen, setSaveModalOpen] = useState(false)
   const [saveData, setSaveData] = useState({ title: '', description: '', isForSale: false, price: 0 })
+  const unmounted = useRef(false)
+
+  useEffect(() => () => { unmounted.current = true }, [])
 
   const handleGenerate = async () => {
     if (!prompt.trim()) {
@@ -69,7 +76,7 @@ export default function Generate() {
         }
       }
 
-      const response = await generateAPI.generate({
+      let response = await generateAPI.generate({
         prompt: finalPrompt,
         negative_prompt: negativePrompt || settings.negative_prompt,
         ai_model: settings.ai_model,
@@ -80,6 +87,20 @@ export default function Generate() {
         num_images: 1,
       })
 
+      // Generation runs in the background; poll until it has finished, the
+      // page is left, or it has taken too long
+      const deadline = Date.now() + POLL_TIMEOUT_MS
+      while (response.data.status === 'pending' || response.data.status === 'processing') {
+        if (Date.now() >= deadline) {
+          toast.error('Generation is taking too long. Please try again later.')
+          return
+        }
+        await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS))
+        if (unmounted.current) return
+        response = await generateAPI.getStatus(response.data.task_id)
+      }
+      if (unmounted.current) return
+
       if (response.data.status === 'completed') {
         setGeneratedImages(response.data.images)
         toast.success('Image generated successfully!')
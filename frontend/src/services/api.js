@@ -102,6 +102,7 @@ export const artworksAPI = {
 export const generateAPI = {
   generate: (data) => api.post('/generate/', data),
   getHistory: () => api.get('/generate/history/'),
+  getStatus: (taskId) => api.get(`/generate/${taskId}/`),
   saveGenerated: (data) => api.post('/generate/save/', data),
 };
 